@@ -120,6 +120,17 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=Node)  # Generic type for Node entities
 
+# Entity type -> SFMService attribute holding its repository
+REPOSITORY_ATTRIBUTES: Dict[Type[Any], str] = {
+    Actor: "_actor_repo",
+    Policy: "_policy_repo",
+    Institution: "_institution_repo",
+    Resource: "_resource_repo",
+    Process: "_process_repo",
+    Flow: "_flow_repo",
+    Relationship: "_relationship_repo",
+}
+
 # Backward compatibility alias
 ValidationError = SFMValidationError
 SFMServiceError = SFMError
@@ -935,18 +946,9 @@ class SFMService:
     def get_entity(self, entity_type: Type[T], entity_id: uuid.UUID) -> Optional[T]:
         """Generic method to retrieve any entity by type and ID."""
         try:
-            repo_mapping: Dict[Type[Any], Any] = {
-                Actor: self._actor_repo,
-                Policy: self._policy_repo,
-                Institution: self._institution_repo,
-                Resource: self._resource_repo,
-                Process: self._process_repo,
-                Flow: self._flow_repo,
-                Relationship: self._relationship_repo,
-                # Add other entity types as needed
-            }
-
-            repo = repo_mapping.get(entity_type)
+            # Resolve through the attribute name so replaced repositories are honoured
+            repo_attribute = REPOSITORY_ATTRIBUTES.get(entity_type)
+            repo = getattr(self, repo_attribute) if repo_attribute else None
             if repo is None:
                 raise ValueError(f"No repository found for entity type: {entity_type}")
 
@@ -55,6 +55,35 @@ class Environment(Enum):
     TESTING = "testing"
 
 
+# Accepted values checked by ConfigLoader.validate_config
+VALID_ENVIRONMENTS = [e.value for e in Environment]
+VALID_LOG_LEVELS = frozenset({'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'})
+
+# Environment variable -> dotted configuration path it overrides
+ENV_VAR_MAPPING = {
+    'SFM_DATABASE_HOST': 'database.host',
+    'SFM_DATABASE_PORT': 'database.port',
+    'SFM_DATABASE_NAME': 'database.name',
+    'SFM_DATABASE_USERNAME': 'database.username',
+    'SFM_DATABASE_PASSWORD': 'database.password',
+    'SFM_CACHE_BACKEND': 'cache.backend',
+    'SFM_CACHE_HOST': 'cache.host',
+    'SFM_CACHE_PORT': 'cache.port',
+    'SFM_LOG_LEVEL': 'logging.level',
+    'SFM_LOG_FORMAT': 'logging.format',
+    'SFM_DEBUG': 'debug',
+    'SFM_ENVIRONMENT': 'environment'
+}
+
+# Secret name -> dotted configuration path it fills in
+SECRET_MAPPINGS = {
+    'database_password': 'database.password',
+    'cache_password': 'cache.password',
+    'secret_key': 'security.secret_key',
+    'encryption_key': 'security.encryption_key'
+}
+
+
 @dataclass
 class DatabaseConfig:
     """Database configuration settings."""
@@ -268,23 +297,8 @@ class ConfigLoader:
         Returns:
             Dict: Configuration overrides
         """
-        env_mapping = {
-            'SFM_DATABASE_HOST': 'database.host',
-            'SFM_DATABASE_PORT': 'database.port',
-            'SFM_DATABASE_NAME': 'database.name',
-            'SFM_DATABASE_USERNAME': 'database.username',
-            'SFM_DATABASE_PASSWORD': 'database.password',
-            'SFM_CACHE_BACKEND': 'cache.backend',
-            'SFM_CACHE_HOST': 'cache.host',
-            'SFM_CACHE_PORT': 'cache.port',
-            'SFM_LOG_LEVEL': 'logging.level',
-            'SFM_LOG_FORMAT': 'logging.format',
-            'SFM_DEBUG': 'debug',
-            'SFM_ENVIRONMENT': 'environment'
-        }
-        
         overrides: Dict[str, Any] = {}
-        for env_var, config_path in env_mapping.items():
+        for env_var, config_path in ENV_VAR_MAPPING.items():
             value = os.getenv(env_var)
             if value is not None:
                 # Convert types appropriately
@@ -392,17 +406,9 @@ class ConfigLoader:
         if not self.secrets_manager:
             return config
         
-        # Define secret mappings
-        secret_mappings = {
-            'database_password': 'database.password',
-            'cache_password': 'cache.password',
-            'secret_key': 'security.secret_key',
-            'encryption_key': 'security.encryption_key'
-        }
-        
         config_dict = config.to_dict()
         
-        for secret_key, config_path in secret_mappings.items():
+        for secret_key, config_path in SECRET_MAPPINGS.items():
             try:
                 secret_value = self.secrets_manager.get_secret(secret_key)
                 if secret_value:
@@ -440,9 +446,8 @@ class ConfigLoader:
             ConfigurationError: If validation fails
         """
         # Validate environment
-        valid_environments = [e.value for e in Environment]
-        if config.environment not in valid_environments:
-            raise ConfigurationError(f"Invalid environment: {config.environment}. Must be one of: {valid_environments}")
+        if config.environment not in VALID_ENVIRONMENTS:
+            raise ConfigurationError(f"Invalid environment: {config.environment}. Must be one of: {VALID_ENVIRONMENTS}")
         
         # Validate database configuration
         if config.database.port < 1 or config.database.port > 65535:
@@ -459,8 +464,7 @@ class ConfigLoader:
             raise ConfigurationError(f"Invalid cache TTL: {config.cache.ttl}")
         
         # Validate logging configuration
-        valid_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-        if config.logging.level not in valid_levels:
+        if config.logging.level not in VALID_LOG_LEVELS:
             raise ConfigurationError(f"Invalid log level: {config.logging.level}")
         
         return True
@@ -8,23 +8,62 @@ from their new organized locations:
 - graph/: Graph operations and network metrics
 """
 
-# Import all classes from the reorganized structure for backward compatibility
-from models.meta_entities import TimeSlice, SpatialUnit, Scenario
-from models.base_nodes import Node
-from models.core_nodes import (
-    Actor, Institution, Policy, Resource, Process, Flow, ValueFlow, GovernanceStructure
-)
-from models.specialized_nodes import (
-    BeliefSystem, TechnologySystem, Indicator, FeedbackLoop, SystemProperty,
-    AnalyticalContext, PolicyInstrument
-)
-from models.behavioral_nodes import (
-    ValueSystem, CeremonialBehavior, InstrumentalBehavior, ChangeProcess,
-    CognitiveFramework, BehavioralPattern
-)
-from models.metadata_models import TemporalDynamics, ValidationRule, ModelMetadata
-from models.relationships import Relationship
-from graph.graph import SFMGraph, NetworkMetrics
+import importlib
+from typing import TYPE_CHECKING, Any, Dict
+
+if TYPE_CHECKING:
+    from models.meta_entities import TimeSlice, SpatialUnit, Scenario
+    from models.base_nodes import Node
+    from models.core_nodes import (
+        Actor, Institution, Policy, Resource, Process, Flow, ValueFlow, GovernanceStructure
+    )
+    from models.specialized_nodes import (
+        BeliefSystem, TechnologySystem, Indicator, FeedbackLoop, SystemProperty,
+        AnalyticalContext, PolicyInstrument
+    )
+    from models.behavioral_nodes import (
+        ValueSystem, CeremonialBehavior, InstrumentalBehavior, ChangeProcess,
+        CognitiveFramework, BehavioralPattern
+    )
+    from models.metadata_models import TemporalDynamics, ValidationRule, ModelMetadata
+    from models.relationships import Relationship
+    from graph.graph import SFMGraph, NetworkMetrics
+
+# Classes re-exported for backward compatibility, mapped to their new modules.
+# They are imported on first attribute access (PEP 562) so that importing this
+# layer does not pull in every model module and the graph stack up front.
+_LAZY_IMPORTS: Dict[str, str] = {
+    **dict.fromkeys(('TimeSlice', 'SpatialUnit', 'Scenario'), 'models.meta_entities'),
+    'Node': 'models.base_nodes',
+    **dict.fromkeys(('Actor', 'Institution', 'Policy', 'Resource', 'Process', 'Flow',
+                     'ValueFlow', 'GovernanceStructure'), 'models.core_nodes'),
+    **dict.fromkeys(('BeliefSystem', 'TechnologySystem', 'Indicator', 'FeedbackLoop',
+                     'SystemProperty', 'AnalyticalContext', 'PolicyInstrument'),
+                    'models.specialized_nodes'),
+    **dict.fromkeys(('ValueSystem', 'CeremonialBehavior', 'InstrumentalBehavior',
+                     'ChangeProcess', 'CognitiveFramework', 'BehavioralPattern'),
+                    'models.behavioral_nodes'),
+    **dict.fromkeys(('TemporalDynamics', 'ValidationRule', 'ModelMetadata'),
+                    'models.metadata_models'),
+    'Relationship': 'models.relationships',
+    **dict.fromkeys(('SFMGraph', 'NetworkMetrics'), 'graph.graph'),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a re-exported class on first access and cache it on the module."""
+    module_path = _LAZY_IMPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    """Include the lazily imported names in dir() output."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 # Public API
 __all__ = [
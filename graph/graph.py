@@ -11,7 +11,7 @@ import uuid
 import logging
 import sys
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Iterator, Callable, Set, Type, Tuple, Any
+from typing import Dict, List, Optional, Iterable, Iterator, Callable, Set, Type, Tuple, Any
 from datetime import datetime
 
 from models.base_nodes import Node
@@ -75,11 +75,18 @@ class NodeTypeRegistry:
             # Graph nodes
             (NetworkMetrics, 'network_metrics'),
         ]
+        # Resolved collection per concrete node class
+        self._collection_by_type: Dict[Type[Node], str] = {}
 
     def get_collection_name(self, node: Node) -> str:
         """Get the collection name for a given node type."""
+        node_class = type(node)
+        collection_name = self._collection_by_type.get(node_class)
+        if collection_name is not None:
+            return collection_name
         for node_type, collection_name in self._type_handlers:
             if isinstance(node, node_type):
+                self._collection_by_type[node_class] = collection_name
                 return collection_name
         raise TypeError(f"Unsupported node type: {type(node)}")
 
@@ -165,6 +172,13 @@ class SFMGraph(EvictableGraph, GraphObservable):  # pylint: disable=too-many-ins
     )
     _relationship_cache_max_size: int = field(default=1000, init=False)
 
+    # Performance optimization: node -> relationships adjacency index, built in one
+    # pass on the first cache miss and dropped by _clear_relationship_cache()
+    _adjacency_index: Optional[Dict[uuid.UUID, List[Relationship]]] = field(
+        default=None, init=False
+    )
+    _adjacency_index_size: int = field(default=0, init=False)
+
     # Performance optimization: Optional lazy loading support
     _lazy_loading_enabled: bool = field(default=False, init=False)
     _node_loader: Optional[Callable[[uuid.UUID], Optional[Node]]] = field(default=None, init=False)
@@ -195,7 +209,7 @@ class SFMGraph(EvictableGraph, GraphObservable):  # pylint: disable=too-many-ins
         """Custom pickle serialization to handle non-serializable objects."""
         state = self.__dict__.copy()
         # Remove non-serializable objects before pickling
-        non_serializable = ['_memory_monitor', '_query_cache']
+        non_serializable = ['_memory_monitor', '_query_cache', '_adjacency_index']
         for key in non_serializable:
             if key in state:
                 del state[key]
@@ -204,6 +218,7 @@ class SFMGraph(EvictableGraph, GraphObservable):  # pylint: disable=too-many-ins
     def __setstate__(self, state: Dict[str, Any]) -> None:
         """Custom pickle deserialization to restore non-serializable objects."""
         self.__dict__.update(state)
+        self._adjacency_index = None
         # Restore non-serializable objects after unpickling
         if getattr(self, '_enable_memory_management', True):
             self._memory_monitor = MemoryMonitor(
@@ -259,7 +274,7 @@ class SFMGraph(EvictableGraph, GraphObservable):  # pylint: disable=too-many-ins
             if self._memory_monitor.should_evict_nodes():
                 evicted = self._memory_monitor.evict_nodes(self)
                 if evicted > 0:
-                    logger.info(f"Evicted {evicted} nodes after adding new node")
+                    logger.info("Evicted %s nodes after adding new node", evicted)
 
         # Cache invalidation
         if self._enable_advanced_caching and hasattr(self, '_query_cache') and self._query_cache:
@@ -270,11 +285,47 @@ class SFMGraph(EvictableGraph, GraphObservable):  # pylint: disable=too-many-ins
 
         return node
 
-    @timed_operation("add_relationship")
-    def add_relationship(self, relationship: Relationship) -> Relationship:
-        """Add a relationship to the SFM graph with validation."""
+    @timed_operation("add_nodes_from")
+    def add_nodes_from(self, nodes: Iterable[Node]) -> List[Node]:
+        """
+        Add several nodes in one pass.
 
-        # Perform SFM-specific validation if both nodes exist
+        Behaves like calling add_node for each node, but checks the memory
+        limit once after the whole batch is stored instead of after every node.
+        An unsupported node type raises TypeError before any node is stored.
+        """
+        placements = [
+            (node, getattr(self, self._node_registry.get_collection_name(node)))
+            for node in nodes
+        ]
+        added: List[Node] = []
+        for node, collection in placements:
+            collection[node.id] = node
+            self._node_index[node.id] = node
+            added.append(node)
+
+        if not added:
+            return added
+
+        # Memory management: Record node access and check memory limits
+        if self._memory_monitor:
+            for node in added:
+                self._memory_monitor.record_node_access(node.id)
+            if self._memory_monitor.should_evict_nodes():
+                evicted = self._memory_monitor.evict_nodes(self)
+                if evicted > 0:
+                    logger.info("Evicted %s nodes after adding %s nodes", evicted, len(added))
+
+        caching = self._enable_advanced_caching and hasattr(self, '_query_cache') and self._query_cache
+        for node in added:
+            if caching:
+                self._query_cache.invalidate_on_event('node_added', node_id=self._get_node_id_for_cache(node.id))  # type: ignore[arg-type]
+            self._notify_node_added(node)
+
+        return added
+
+    def _validate_relationship(self, relationship: Relationship) -> None:
+        """Validate a relationship's SFM context when both endpoints are present."""
         source_node = self._find_node_by_id(relationship.source_id)
         target_node = self._find_node_by_id(relationship.target_id)
 
@@ -287,6 +338,13 @@ class SFMGraph(EvictableGraph, GraphObservable):  # pylint: disable=too-many-ins
                 relationship.kind, source_type, target_type
             )
 
+    @timed_operation("add_relationship")
+    def add_relationship(self, relationship: Relationship) -> Relationship:
+        """Add a relationship to the SFM graph with validation."""
+
+        # Perform SFM-specific validation if both nodes exist
+        self._validate_relationship(relationship)
+
         # Store the relationship
         self.relationships[relationship.id] = relationship
 
@@ -304,6 +362,36 @@ class SFMGraph(EvictableGraph, GraphObservable):  # pylint: disable=too-many-ins
 
         return relationship
 
+    @timed_operation("add_relationships_from")
+    def add_relationships_from(self, relationships: Iterable[Relationship]) -> List[Relationship]:
+        """
+        Add several relationships in one pass.
+
+        Every relationship is validated before any is stored, so an invalid
+        entry leaves the graph unchanged. The relationship cache is cleared
+        once for the batch, and observers are notified after all are stored.
+        """
+        batch = list(relationships)
+        for relationship in batch:
+            self._validate_relationship(relationship)
+
+        if not batch:
+            return batch
+
+        for relationship in batch:
+            self.relationships[relationship.id] = relationship
+        self._clear_relationship_cache()
+
+        caching = self._enable_advanced_caching and hasattr(self, '_query_cache') and self._query_cache
+        for relationship in batch:
+            if caching:
+                self._query_cache.invalidate_on_event('relationship_added',
+                                                   source_id=self._get_node_id_for_cache(relationship.source_id),
+                                                   target_id=self._get_node_id_for_cache(relationship.target_id))
+            self._notify_relationship_added(relationship)
+
+        return batch
+
     def _find_node_by_id(self, node_id: uuid.UUID) -> Optional[Node]:
         """Find a node by its ID using central index for O(1) lookup."""
         if self._lazy_loading_enabled:
@@ -340,10 +428,28 @@ class SFMGraph(EvictableGraph, GraphObservable):  # pylint: disable=too-many-ins
         # Performance optimization: Clear index and cache
         self._node_index.clear()
         self._relationship_cache.clear()
+        self._adjacency_index = None
 
     def _clear_relationship_cache(self) -> None:
         """Clear the relationship cache when relationships change."""
         self._relationship_cache.clear()
+        self._adjacency_index = None
+
+    def _get_adjacency_index(self) -> Dict[uuid.UUID, List[Relationship]]:
+        """Return the node -> relationships index, rebuilding it if stale."""
+        index = self._adjacency_index
+        # The size check only notices direct edits to self.relationships that
+        # change its length; code that replaces or rewires relationships in
+        # place must call _clear_relationship_cache()
+        if index is None or self._adjacency_index_size != len(self.relationships):
+            index = {}
+            for relationship in self.relationships.values():
+                index.setdefault(relationship.source_id, []).append(relationship)
+                if relationship.target_id != relationship.source_id:
+                    index.setdefault(relationship.target_id, []).append(relationship)
+            self._adjacency_index = index
+            self._adjacency_index_size = len(self.relationships)
+        return index
 
     def _get_node_id_for_cache(self, node_id: uuid.UUID) -> str:
         """Convert node ID to string format for cache operations."""
@@ -369,10 +475,7 @@ class SFMGraph(EvictableGraph, GraphObservable):  # pylint: disable=too-many-ins
             return relationships
 
         # Compute relationships for this node
-        relationships: List[Relationship] = []
-        for relationship in self.relationships.values():
-            if node_id in (relationship.source_id, relationship.target_id):
-                relationships.append(relationship)
+        relationships: List[Relationship] = list(self._get_adjacency_index().get(node_id, ()))
 
         # Cache result with simple size management
         if len(self._relationship_cache) >= self._relationship_cache_max_size:
@@ -450,11 +553,11 @@ class SFMGraph(EvictableGraph, GraphObservable):  # pylint: disable=too-many-ins
                 hasattr(self, '_query_cache') and self._query_cache):
                 self._query_cache.invalidate_on_event('node_removed', node_id=self._get_node_id_for_cache(node_id))  # type: ignore[arg-type]
             
-            logger.debug(f"Evicted node {node_id} from memory")
+            logger.debug("Evicted node %s from memory", node_id)
             return True
             
         except Exception as e:
-            logger.error(f"Failed to remove node {node_id} from memory: {e}")
+            logger.error("Failed to remove node %s from memory: %s", node_id, e)
             return False
 
     def get_node_size_estimate(self, node_id: uuid.UUID) -> int:
@@ -529,6 +632,7 @@ class SFMGraph(EvictableGraph, GraphObservable):  # pylint: disable=too-many-ins
     def clear_all_caches(self) -> None:
         """Clear all caches."""
         self._relationship_cache.clear()
+        self._adjacency_index = None
         if (self._enable_advanced_caching and 
             hasattr(self, '_query_cache') and self._query_cache):
             self._query_cache.clear()
@@ -16,23 +16,24 @@ import time
 import threading
 import pickle
 import hashlib
+import importlib
+import importlib.util
 from abc import ABC, abstractmethod
 from collections import OrderedDict
 from contextlib import nullcontext
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Any, Callable, TypeVar, cast
+from typing import Dict, List, Optional, Any, Callable, Tuple, TypeVar, cast
 from enum import Enum
 from functools import wraps
 
 import logging
 logger = logging.getLogger(__name__)
 
-# Optional Redis import - gracefully handle if not available
-try:
-    import redis
-    REDIS_AVAILABLE = True
-except ImportError:
-    REDIS_AVAILABLE = False
+# Optional Redis support - only probe for the package here; redis-py itself is
+# imported when a RedisCache first builds its own client, since importing it
+# (and its asyncio stack) dominates this module's import time
+REDIS_AVAILABLE = importlib.util.find_spec("redis") is not None
+if not REDIS_AVAILABLE:
     logger.warning("Redis not available - RedisCache will be disabled")
 
 # Optional Prometheus metrics import
@@ -180,43 +181,50 @@ class MemoryCache(CacheBackend):
 
     def __init__(self, name: str, max_size: int = 1000):
         super().__init__(name, max_size)
-        self._cache: Dict[str, Any] = {}
-        self._access_order: OrderedDict[str, None] = OrderedDict()
+        # (value, time.monotonic() deadline or None) in LRU order (least
+        # recently used first), so one map serves both lookups and eviction
+        self._cache: OrderedDict[str, Tuple[Any, Optional[float]]] = OrderedDict()
 
     def get(self, key: str) -> Optional[Any]:
         with self._lock:
-            if key in self._cache:
-                # Update access order (LRU)
-                self._access_order.move_to_end(key)
-                self.stats.record_hit()
-                return self._cache[key]
-            self.stats.record_miss()
-            return None
+            entry = self._cache.get(key)
+            if entry is None:
+                self.stats.record_miss()
+                return None
+            value, expiry_time = entry
+            if expiry_time is not None and time.monotonic() > expiry_time:
+                del self._cache[key]
+                self.stats.record_expired()
+                self.stats.record_miss()
+                return None
+            # Update access order (LRU)
+            self._cache.move_to_end(key)
+            self.stats.record_hit()
+            return value
 
     def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
         with self._lock:
+            # Entries without a ttl never expire
+            expiry_time = time.monotonic() + ttl if ttl is not None else None
+
             # Handle size limit
             if key not in self._cache and len(self._cache) >= self.max_size:
                 # Evict LRU item
-                oldest_key, _ = self._access_order.popitem(last=False)
-                del self._cache[oldest_key]
+                self._cache.popitem(last=False)
                 self.stats.record_evicted()
 
-            self._cache[key] = value
-            self._access_order[key] = None
+            self._cache[key] = (value, expiry_time)
 
     def delete(self, key: str) -> bool:
         with self._lock:
             if key in self._cache:
                 del self._cache[key]
-                self._access_order.pop(key, None)
                 return True
             return False
 
     def clear(self) -> None:
         with self._lock:
             self._cache.clear()
-            self._access_order.clear()
 
     def keys(self) -> List[str]:
         with self._lock:
@@ -229,73 +237,68 @@ class TTLMemoryCache(CacheBackend):
     @dataclass
     class CacheEntry:
         value: Any
-        expiry_time: float
+        expiry_time: float  # time.monotonic() deadline
 
         def is_expired(self) -> bool:
-            return time.time() > self.expiry_time
+            return time.monotonic() > self.expiry_time
 
     def __init__(self, name: str, max_size: int = 1000, default_ttl: float = 3600):
         super().__init__(name, max_size)
         self.default_ttl = default_ttl
-        self._cache: Dict[str, TTLMemoryCache.CacheEntry] = {}
-        self._access_order: OrderedDict[str, None] = OrderedDict()
+        # Entries in LRU order (least recently used first)
+        self._cache: OrderedDict[str, TTLMemoryCache.CacheEntry] = OrderedDict()
 
     def get(self, key: str) -> Optional[Any]:
         with self._lock:
-            if key in self._cache:
-                entry = self._cache[key]
-                if entry.is_expired():
-                    # Clean up expired entry
-                    del self._cache[key]
-                    self._access_order.pop(key, None)
-                    self.stats.record_expired()
-                    self.stats.record_miss()
-                    return None
-                # Update access order
-                self._access_order.move_to_end(key)
-                self.stats.record_hit()
-                return entry.value
-            self.stats.record_miss()
-            return None
+            entry = self._cache.get(key)
+            if entry is None:
+                self.stats.record_miss()
+                return None
+            if entry.is_expired():
+                # Clean up expired entry
+                del self._cache[key]
+                self.stats.record_expired()
+                self.stats.record_miss()
+                return None
+            # Update access order
+            self._cache.move_to_end(key)
+            self.stats.record_hit()
+            return entry.value
 
     def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
         with self._lock:
-            expiry_time = time.time() + (ttl or self.default_ttl)
+            # Monotonic deadlines are unaffected by wall-clock adjustments
+            expiry_time = time.monotonic() + (ttl or self.default_ttl)
 
             # Handle size limit
             if key not in self._cache and len(self._cache) >= self.max_size:
                 # Evict oldest item
-                oldest_key, _ = self._access_order.popitem(last=False)
-                del self._cache[oldest_key]
+                self._cache.popitem(last=False)
                 self.stats.record_evicted()
 
             self._cache[key] = self.CacheEntry(value, expiry_time)
-            self._access_order[key] = None
 
     def delete(self, key: str) -> bool:
         with self._lock:
             if key in self._cache:
                 del self._cache[key]
-                self._access_order.pop(key, None)
                 return True
             return False
 
     def clear(self) -> None:
         with self._lock:
             self._cache.clear()
-            self._access_order.clear()
 
     def keys(self) -> List[str]:
         with self._lock:
             # Clean up expired entries while getting keys
-            current_time = time.time()
+            current_time = time.monotonic()
             expired_keys = [
                 key for key, entry in self._cache.items()
                 if entry.expiry_time <= current_time
             ]
             for key in expired_keys:
                 del self._cache[key]
-                self._access_order.pop(key, None)
                 self.stats.record_expired()
 
             return list(self._cache.keys())
@@ -317,6 +320,7 @@ class RedisCache(CacheBackend):
         if redis_client:
             self.redis = redis_client
         else:
+            redis = importlib.import_module("redis")
             self.redis = redis.Redis(
                 host=host, port=port, db=db, password=password, decode_responses=False
             )
@@ -527,22 +531,11 @@ class QueryCache:
         if operation in self._key_generators:
             return self._key_generators[operation](*args, **kwargs)
 
-        # Default key generation
+        # Default key generation: entities contribute their id, other values their str()
         key_parts = [operation]
-
-        # Add args
-        for arg in args:
-            if hasattr(arg, 'id'):
-                key_parts.append(str(arg.id))
-            else:
-                key_parts.append(str(arg))
-
-        # Add kwargs
-        for k, v in sorted(kwargs.items()):
-            if hasattr(v, 'id'):
-                key_parts.append(f"{k}:{getattr(v, 'id', v)}")
-            else:
-                key_parts.append(f"{k}:{v}")
+        key_parts.extend([str(getattr(arg, 'id', arg)) for arg in args])
+        if kwargs:
+            key_parts.extend([f"{k}:{getattr(v, 'id', v)}" for k, v in sorted(kwargs.items())])
 
         return ":".join(key_parts)
 
@@ -733,10 +726,21 @@ def cached(ttl: int = 3600, cache_key_func: Optional[Callable[..., str]] = None,
     del invalidate_on  # Explicitly mark as unused to avoid linter warnings
 
     def decorator(func: F) -> F:
+        default_cache: Optional[QueryCache] = None
+
+        def _resolve_cache() -> QueryCache:
+            # Use the provided cache instance, or one default cache per decorated
+            # function created on first use so results survive between calls
+            nonlocal default_cache
+            if cache_instance is not None:
+                return cache_instance
+            if default_cache is None:
+                default_cache = QueryCache()
+            return default_cache
+
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            # Use provided cache instance or create a default one
-            cache = cache_instance or QueryCache()
+            cache = _resolve_cache()
 
             # Generate cache key
             if cache_key_func:
@@ -744,7 +748,7 @@ def cached(ttl: int = 3600, cache_key_func: Optional[Callable[..., str]] = None,
             else:
                 # Create a hash-based key for complex arguments
                 key_data = f"{func.__name__}:{str(args)}:{str(sorted(kwargs.items()))}"
-                cache_key = f"{func.__name__}:{hashlib.md5(key_data.encode()).hexdigest()}"
+                cache_key = f"{func.__name__}:{hashlib.blake2b(key_data.encode(), digest_size=16).hexdigest()}"
 
             # Try to get from cache
             with cache_metrics.time_operation(cache.name, "get"):
@@ -762,7 +766,7 @@ def cached(ttl: int = 3600, cache_key_func: Optional[Callable[..., str]] = None,
 
         # Add cache invalidation method to the wrapper
         def _invalidate_cache():
-            cache = cache_instance or QueryCache()
+            cache = _resolve_cache()
             cache._cache.delete_pattern(f"{func.__name__}:*")  # pylint: disable=protected-access
 
         # Set attribute on wrapper function
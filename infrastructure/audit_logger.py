@@ -209,8 +209,9 @@ class AuditLogger:
         }
 
 
-# Global audit logger instance
-_global_audit_logger = AuditLogger()
+# Global audit logger instance, created on first use so importing this module
+# does not attach handlers to the "sfm.audit" logger.
+_global_audit_logger: Optional[AuditLogger] = None
 
 
 F = TypeVar("F", bound=Callable[..., Any])
@@ -256,7 +257,7 @@ def audit_operation(operation_type: OperationType, operation_name: Optional[str]
                         entity_id = str(result['id'])
                     else:
                         entity_id = None
-                _global_audit_logger.log_operation(
+                get_audit_logger().log_operation(
                     operation_type=operation_type,
                     operation_name=op_name,
                     entity_type=entity_type,
@@ -267,7 +268,7 @@ def audit_operation(operation_type: OperationType, operation_name: Optional[str]
                     transaction_id=transaction_id
                 )
                 if include_performance:
-                    _global_audit_logger.log_performance_event(
+                    get_audit_logger().log_performance_event(
                         operation_name=op_name,
                         duration=duration,
                         entity_type=entity_type,
@@ -290,7 +291,7 @@ def audit_operation(operation_type: OperationType, operation_name: Optional[str]
                     error_details=str(e),
                     performance_metrics={"duration_seconds": duration}
                 )
-                _global_audit_logger.log_event(event)
+                get_audit_logger().log_event(event)
 
                 raise
 
@@ -301,29 +302,32 @@ def audit_operation(operation_type: OperationType, operation_name: Optional[str]
 # Convenience functions for common operations
 def log_operation(operation_type: OperationType, operation_name: str, **kwargs: Any) -> None:
     """Log an operation using the global audit logger."""
-    _global_audit_logger.log_operation(operation_type, operation_name, **kwargs)
+    get_audit_logger().log_operation(operation_type, operation_name, **kwargs)
 
 
 def log_security_event(message: str, security_context: Dict[str, Any], **kwargs: Any) -> None:
     """Log a security event using the global audit logger."""
-    _global_audit_logger.log_security_event(message, security_context, **kwargs)
+    get_audit_logger().log_security_event(message, security_context, **kwargs)
 
 
 def log_performance_event(operation_name: str, duration: float, **kwargs: Any) -> None:
     """Log a performance event using the global audit logger."""
-    _global_audit_logger.log_performance_event(operation_name, duration, **kwargs)
+    get_audit_logger().log_performance_event(operation_name, duration, **kwargs)
 
 
 def get_audit_logger() -> AuditLogger:
     """Get the global audit logger."""
+    global _global_audit_logger
+    if _global_audit_logger is None:
+        _global_audit_logger = AuditLogger()
     return _global_audit_logger
 
 
 def set_user_context(user_id: str, session_id: Optional[str] = None):
     """Set user context for the global audit logger."""
-    _global_audit_logger.set_user_context(user_id, session_id)
+    get_audit_logger().set_user_context(user_id, session_id)
 
 
 def clear_user_context():
     """Clear user context for the global audit logger."""
-    _global_audit_logger.clear_user_context()
+    get_audit_logger().clear_user_context()
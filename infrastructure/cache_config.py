@@ -5,11 +5,12 @@ This module provides configuration classes and default settings for the
 advanced caching system.
 """
 
+import copy
 from typing import Dict, Any, Optional
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True)
 class CacheLayerConfig:
     """Configuration for individual cache layers."""
     backend: str = 'memory'
@@ -73,16 +74,24 @@ class CacheConfigManager:
     """Manager for cache configuration settings."""
     
     def __init__(self, config: Optional[Dict[str, Any]] = None):
-        self.config = config or CACHE_CONFIG.copy()
+        # Deep copies keep nested layer settings private to this manager; write
+        # them through update_config(), which also clears the memo below
+        self.config = copy.deepcopy(config or CACHE_CONFIG)
+        # Resolved layer configs, rebuilt after update_config()
+        self._layer_configs: Dict[str, CacheLayerConfig] = {}
     
     def get_layer_config(self, layer_name: str) -> CacheLayerConfig:
         """Get configuration for a specific cache layer."""
-        layer_config = self.config.get(layer_name, self.config['default'])
-        return CacheLayerConfig(
-            backend=layer_config.get('backend', 'memory'),
-            ttl=layer_config.get('ttl', 3600),
-            max_size=layer_config.get('max_size', 1000)
-        )
+        layer = self._layer_configs.get(layer_name)
+        if layer is None:
+            layer_config = self.config.get(layer_name, self.config['default'])
+            layer = CacheLayerConfig(
+                backend=layer_config.get('backend', 'memory'),
+                ttl=layer_config.get('ttl', 3600),
+                max_size=layer_config.get('max_size', 1000)
+            )
+            self._layer_configs[layer_name] = layer
+        return layer
     
     def get_redis_config(self) -> RedisConfig:
         """Get Redis configuration."""
@@ -96,8 +105,9 @@ class CacheConfigManager:
     
     def update_config(self, updates: Dict[str, Any]) -> None:
         """Update configuration with new values."""
-        self.config.update(updates)
+        self.config.update(copy.deepcopy(updates))
+        self._layer_configs.clear()
     
     def get_config(self) -> Dict[str, Any]:
         """Get the full configuration."""
-        return self.config.copy()
\ No newline at end of file
+        return copy.deepcopy(self.config)
\ No newline at end of file
@@ -18,15 +18,52 @@ import json
 import time
 import uuid
 from typing import Dict, Any, Optional, Union
-from datetime import datetime
+from datetime import date, datetime, time as dt_time
+from enum import Enum
 from contextlib import contextmanager
 from functools import wraps
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field, is_dataclass
+
+# Optional orjson backend: serializes log records (including datetimes)
+# several times faster than the stdlib encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
 
 # Import existing audit logging for integration
 from infrastructure.audit_logger import AuditLogger, AuditLevel, OperationType
 
 
+def _json_default(value: Any) -> Any:
+    """Encode values the stdlib JSON encoder does not handle natively, as orjson would."""
+    if isinstance(value, (date, dt_time)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, Enum):
+        return value.value
+    if is_dataclass(value) and not isinstance(value, type):
+        return asdict(value)
+    # Last resort, so a log call never fails on an unexpected value
+    return str(value)
+
+
+def _dumps_log_record(log_data: Dict[str, Any]) -> str:
+    """Serialize a structured log record to a compact JSON string."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(log_data, option=orjson.OPT_NON_STR_KEYS).decode()
+        except TypeError:
+            # Values orjson rejects (e.g. integers wider than 64 bits) fall
+            # through to the stdlib encoder
+            pass
+    # Same compact, UTF-8 output as orjson
+    return json.dumps(log_data, default=_json_default, separators=(",", ":"), ensure_ascii=False)
+
+
 @dataclass
 class LogContext:
     """Context information for structured logging."""
@@ -64,6 +101,10 @@ class SFMLogger:
         )
         return new_logger
     
+    def is_enabled_for(self, level: str) -> bool:
+        """Check whether records at level would be emitted."""
+        return self.logger.isEnabledFor(getattr(logging, level))
+    
     def info(self, message: str, **kwargs):
         """Log an info message with structured format."""
         self._log('INFO', message, **kwargs)
@@ -86,8 +127,13 @@ class SFMLogger:
     
     def _log(self, level: str, message: str, **kwargs):
         """Internal method to format and log messages."""
+        levelno = getattr(logging, level)
+        # Skip the timestamp, record dict and JSON encoding for dropped levels
+        if not self.logger.isEnabledFor(levelno):
+            return
+        
         log_data = {
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': datetime.utcnow(),
             'level': level,
             'message': message,
             'correlation_id': self.correlation_id,
@@ -105,7 +151,7 @@ class SFMLogger:
         # Remove None values from context
         log_data['context'] = {k: v for k, v in log_data['context'].items() if v is not None}
         
-        self.logger.log(getattr(logging, level), json.dumps(log_data))
+        self.logger.log(levelno, _dumps_log_record(log_data))
 
 
 class LoggingManager:
@@ -150,7 +196,7 @@ class LoggingManager:
     @contextmanager
     def operation_context(self, operation: str, component: str = None, **kwargs):
         """Context manager for operation logging."""
-        correlation_id = kwargs.get('correlation_id', str(uuid.uuid4()))
+        correlation_id = kwargs.get('correlation_id') or str(uuid.uuid4())
         logger = self.get_logger(f"sfm.{component}" if component else "sfm.operation", correlation_id)
         logger = logger.with_context(operation=operation, component=component, **kwargs)
         
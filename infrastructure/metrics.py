@@ -15,7 +15,7 @@ Features:
 
 import time
 import logging
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Mapping
 from functools import wraps
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -33,6 +33,24 @@ try:
 except ImportError:
     PROMETHEUS_AVAILABLE = False
 
+# Endpoint label shared by requests that matched no route (404 probes and
+# other unrouted URLs), so arbitrary paths cannot create new label values
+UNMATCHED_ENDPOINT = "other"
+
+
+def endpoint_label(scope: Mapping[str, Any], status: Optional[int] = None) -> str:
+    """
+    Return the metric endpoint label for an ASGI request scope.
+    
+    Requests are labelled by the template of the route that handled them
+    (e.g. ``/actors/{actor_id}``), which the router stores in
+    ``scope["route"]``, so every entity URL shares one series. Unmatched and
+    404 requests are labelled UNMATCHED_ENDPOINT.
+    """
+    if status == 404:
+        return UNMATCHED_ENDPOINT
+    return getattr(scope.get("route"), "path", None) or UNMATCHED_ENDPOINT
+
 
 @dataclass
 class MetricConfig:
@@ -265,7 +283,12 @@ class MetricsCollector:
             self.logger.info("Metrics collector initialized without Prometheus support")
     
     def record_request(self, method: str, endpoint: str, status: int, duration: float):
-        """Record HTTP request metrics."""
+        """
+        Record HTTP request metrics.
+        
+        The endpoint should be a bounded label such as the one returned by
+        endpoint_label(), not a raw request path.
+        """
         # Record in performance metrics
         self.performance_metrics.record_operation(
             f"http_{method}_{endpoint}",
@@ -23,7 +23,10 @@ from starlette.types import ASGIApp
 import json
 
 from infrastructure.logging_config import get_logger, LoggingManager
-from infrastructure.metrics import get_metrics_collector
+from infrastructure.metrics import endpoint_label, get_metrics_collector
+
+# ASGI header names are lower-case byte strings
+CORRELATION_ID_HEADER = b"x-correlation-id"
 
 
 class MonitoringMiddleware(BaseHTTPMiddleware):
@@ -97,8 +100,11 @@ class MonitoringMiddleware(BaseHTTPMiddleware):
             # Record metrics
             self._record_metrics(request, response, duration)
             
-            # Add correlation ID to response headers
-            response.headers["X-Correlation-ID"] = correlation_id
+            # Set the correlation ID response header, replacing any the app
+            # set; the raw pair skips MutableHeaders' name normalisation
+            raw_headers = response.raw_headers
+            raw_headers[:] = [pair for pair in raw_headers if pair[0] != CORRELATION_ID_HEADER]
+            raw_headers.append((CORRELATION_ID_HEADER, correlation_id.encode("latin-1")))
             
             return response
             
@@ -118,7 +124,7 @@ class MonitoringMiddleware(BaseHTTPMiddleware):
             self.metrics_collector.record_error(type(e).__name__, str(e))
             self.metrics_collector.record_request(
                 request.method, 
-                request.url.path, 
+                endpoint_label(request.scope, 500), 
                 500, 
                 duration
             )
@@ -128,6 +134,10 @@ class MonitoringMiddleware(BaseHTTPMiddleware):
     
     async def _log_request(self, request: Request, logger):
         """Log request details."""
+        # Don't collect request details (or read the body) for a dropped record
+        if not logger.is_enabled_for('INFO'):
+            return
+        
         # Prepare request data
         request_data = {
             'method': request.method,
@@ -159,6 +169,17 @@ class MonitoringMiddleware(BaseHTTPMiddleware):
     
     async def _log_response(self, request: Request, response: Response, duration: float, logger):
         """Log response details."""
+        # Determine log level based on status code
+        if response.status_code >= 500:
+            log_level = 'error'
+        elif response.status_code >= 400:
+            log_level = 'warning'
+        else:
+            log_level = 'info'
+        
+        if not logger.is_enabled_for(log_level.upper()):
+            return
+        
         # Prepare response data
         response_data = {
             'status_code': response.status_code,
@@ -171,14 +192,6 @@ class MonitoringMiddleware(BaseHTTPMiddleware):
         if self.log_headers:
             response_data['headers'] = dict(response.headers)
         
-        # Determine log level based on status code
-        if response.status_code >= 500:
-            log_level = 'error'
-        elif response.status_code >= 400:
-            log_level = 'warning'
-        else:
-            log_level = 'info'
-        
         getattr(logger, log_level)(
             f"Request completed - {response.status_code}",
             **response_data
@@ -188,7 +201,7 @@ class MonitoringMiddleware(BaseHTTPMiddleware):
         """Record request metrics."""
         self.metrics_collector.record_request(
             request.method,
-            request.url.path,
+            endpoint_label(request.scope, response.status_code),
             response.status_code,
             duration
         )
@@ -214,9 +227,9 @@ class CorrelationIdMiddleware:
         # Generate or extract correlation ID
         correlation_id = None
         
-        # Check for existing correlation ID in headers
+        # Check for existing correlation ID in headers (names arrive lower-cased)
         for header_name, header_value in scope.get("headers", []):
-            if header_name.lower() == b"x-correlation-id":
+            if header_name == CORRELATION_ID_HEADER:
                 correlation_id = header_value.decode("utf-8")
                 break
         
@@ -251,7 +264,6 @@ class MetricsMiddleware:
         
         # Extract request information
         method = scope["method"]
-        path = scope["path"]
         
         # Record start time
         start_time = time.time()
@@ -277,7 +289,10 @@ class MetricsMiddleware:
         finally:
             # Record metrics
             duration = time.time() - start_time
-            self.metrics_collector.record_request(method, path, status_code, duration)
+            # The router records the matched route in scope while handling the request
+            self.metrics_collector.record_request(
+                method, endpoint_label(scope, status_code), status_code, duration
+            )
 
 
 class ErrorTrackingMiddleware:
@@ -17,12 +17,21 @@ import re
 import html
 import logging
 import time
-from functools import wraps
+from functools import lru_cache, wraps
 from collections import defaultdict, deque
 from typing import Any, Deque, DefaultDict, Dict, Optional, List, cast, Callable
 from urllib.parse import urlparse
 import bleach
 
+# Optional RE2 backend: guaranteed linear-time matching for the
+# dangerous-content scan, with no catastrophic backtracking
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    re2 = None
+    RE2_AVAILABLE = False
+
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -34,10 +43,17 @@ VALIDATION_RATE_LIMITING_ENABLED = True  # Can be disabled for testing
 validation_rate_storage: DefaultDict[str, Deque[float]] = defaultdict(deque)
 _current_caller_context: Optional[str] = None  # Global context for current caller
 
-# Bleach configuration for advanced HTML sanitization
-ALLOWED_TAGS = ['b', 'i', 'em', 'strong', 'u', 'br', 'p']
-ALLOWED_ATTRIBUTES = {}
-ALLOWED_PROTOCOLS = ['http', 'https', 'mailto']
+# Bleach configuration for advanced HTML sanitization; frozensets match
+# what bleach checks membership against, so they are used as-is per call
+ALLOWED_TAGS = frozenset({'b', 'i', 'em', 'strong', 'u', 'br', 'p'})
+ALLOWED_ATTRIBUTES: Dict[str, List[str]] = {}
+ALLOWED_PROTOCOLS = frozenset({'http', 'https', 'mailto'})
+
+# Metadata value types returned unchanged by _sanitize_value
+_PASSTHROUGH_TYPES = frozenset({int, float, bool})
+
+# Node data fields validated individually by validate_and_sanitize_node_data
+_NODE_DATA_VALIDATED_FIELDS = frozenset({"name", "label", "description", "meta"})
 
 # Public API
 __all__ = [
@@ -67,9 +83,10 @@ MAX_METADATA_KEYS = 50
 MAX_METADATA_VALUE_LENGTH = 500
 MAX_METADATA_DEPTH = 3
 
-# Dangerous patterns to detect and sanitize
+# Dangerous patterns to detect and sanitize; keep them within RE2 syntax
+# (no lookaround or backreferences) so either backend can compile them
 DANGEROUS_PATTERNS = [
-    r'<script\b[^<]*(?:(?!<\/script>)<[^<]*)*<\/script>',  # Script tags
+    r'<script\b[\s\S]*?</script>',  # Script tags
     r'javascript:',  # JavaScript URLs
     r'vbscript:',    # VBScript URLs
     r'on\w+\s*=',    # Event handlers (onclick, onload, etc.)
@@ -77,8 +94,28 @@ DANGEROUS_PATTERNS = [
     r'expression\s*\(',  # CSS expressions
 ]
 
-# Compile regex patterns for better performance
-DANGEROUS_REGEX = re.compile('|'.join(DANGEROUS_PATTERNS), re.IGNORECASE)
+# Number of distinct strings whose sanitized form is memoised
+SANITIZE_CACHE_SIZE = 4096
+
+# Characters bleach may rewrite: markup delimiters and the ASCII control
+# characters it normalises (tab and newline pass through unchanged)
+BLEACH_TRIGGER_REGEX = re.compile(r'[<>&\x00-\x08\x0b-\x1f]')
+
+# Compile all patterns into one alternation so the input is scanned once;
+# each alternative is a named group so a match reports which pattern fired
+_DANGEROUS_ALTERNATION = '|'.join(
+    f'(?P<p{i}>{pattern})' for i, pattern in enumerate(DANGEROUS_PATTERNS)
+)
+if RE2_AVAILABLE:
+    _re2_options = re2.Options()
+    _re2_options.case_sensitive = False
+    DANGEROUS_REGEX = re2.compile(_DANGEROUS_ALTERNATION, _re2_options)
+else:
+    DANGEROUS_REGEX = re.compile(_DANGEROUS_ALTERNATION, re.IGNORECASE)
+
+# URL schemes rejected by validate_url, matched case-insensitively in place
+# so the URL is never lower-cased into a copy
+DANGEROUS_URL_SCHEME_REGEX = re.compile(r'(?:javascript|vbscript|data):', re.IGNORECASE)
 
 
 def rate_limit_validation(func: Callable) -> Callable:
@@ -184,29 +221,23 @@ def sanitize_string(value: str, max_length: int = MAX_STRING_LENGTH) -> str:
         raise error
 
     # Check for dangerous patterns first
-    if DANGEROUS_REGEX.search(value):
+    match = DANGEROUS_REGEX.search(value)
+    if match:
         error = SecurityValidationError(
             "Input contains potentially dangerous content",
             field="content",
             value=value[:50] + "..." if len(value) > 50 else value,
-            context={"patterns_detected": True}
+            context={
+                "patterns_detected": True,
+                "pattern": DANGEROUS_PATTERNS[int(match.lastgroup[1:])]
+            }
         )
         error.log_failure(logger)
         raise error
 
     # Use bleach for advanced HTML sanitization
     try:
-        # First pass: Clean with bleach
-        cleaned = bleach.clean(
-            value,
-            tags=ALLOWED_TAGS,
-            attributes=ALLOWED_ATTRIBUTES,
-            protocols=ALLOWED_PROTOCOLS,
-            strip=True
-        )
-        
-        # Second pass: HTML escape any remaining content
-        sanitized = html.escape(cleaned, quote=True)
+        sanitized = _clean_html(value)
         
         # Log if content was modified during sanitization
         if sanitized != original_value:
@@ -228,6 +259,38 @@ def sanitize_string(value: str, max_length: int = MAX_STRING_LENGTH) -> str:
         raise error
 
 
+@lru_cache(maxsize=SANITIZE_CACHE_SIZE)
+def _clean_html(value: str) -> str:
+    """
+    Clean value with bleach and HTML-escape the result.
+
+    The output depends only on value, so results are memoised; repeated
+    labels and metadata keys skip the HTML parse, as does any string with
+    nothing for bleach to rewrite. Failures raise and are never cached.
+
+    Args:
+        value: String that passed the length and dangerous-pattern checks
+
+    Returns:
+        Sanitized string
+    """
+    # Plain text comes back from bleach unchanged, so skip the HTML parse
+    if not BLEACH_TRIGGER_REGEX.search(value):
+        return html.escape(value, quote=True)
+
+    # First pass: Clean with bleach
+    cleaned = bleach.clean(
+        value,
+        tags=ALLOWED_TAGS,
+        attributes=ALLOWED_ATTRIBUTES,
+        protocols=ALLOWED_PROTOCOLS,
+        strip=True
+    )
+
+    # Second pass: HTML escape any remaining content
+    return html.escape(cleaned, quote=True)
+
+
 def sanitize_description(value: str) -> str:
     """
     Sanitize a description field with longer length allowance.
@@ -301,28 +364,10 @@ def _sanitize_dict(data: Dict[Any, Any], depth: int) -> Dict[str, Any]:
         error.log_failure(logger)
         raise error
 
-    sanitized: Dict[str, Any] = {}
-    for key, value in data.items():
-        # Sanitize key
-        key_str: str = str(key)
-        sanitized_key = sanitize_string(key_str, MAX_METADATA_VALUE_LENGTH)
-
-        # Sanitize value based on type
-        if isinstance(value, str):
-            sanitized[sanitized_key] = sanitize_string(value, MAX_METADATA_VALUE_LENGTH)
-        elif isinstance(value, dict):
-            sanitized[sanitized_key] = _sanitize_dict(cast(Dict[Any, Any], value), depth - 1)
-        elif isinstance(value, list):
-            sanitized[sanitized_key] = _sanitize_list(cast(List[Any], value), depth - 1)
-        elif isinstance(value, (int, float, bool)):
-            sanitized[sanitized_key] = value
-        elif value is None:
-            sanitized[sanitized_key] = None
-        else:
-            # Convert unknown types to sanitized strings
-            sanitized[sanitized_key] = sanitize_string(str(value), MAX_METADATA_VALUE_LENGTH)
-
-    return sanitized
+    return {
+        sanitize_string(str(key), MAX_METADATA_VALUE_LENGTH): _sanitize_value(value, depth)
+        for key, value in data.items()
+    }
 
 
 def _sanitize_list(data: List[Any], depth: int) -> List[Any]:
@@ -346,22 +391,39 @@ def _sanitize_list(data: List[Any], depth: int) -> List[Any]:
         error.log_failure(logger)
         raise error
 
-    sanitized: List[Any] = []
-    for item in data:
-        if isinstance(item, str):
-            sanitized.append(sanitize_string(item, MAX_METADATA_VALUE_LENGTH))
-        elif isinstance(item, dict):
-            sanitized.append(_sanitize_dict(cast(Dict[Any, Any], item), depth - 1))
-        elif isinstance(item, list):
-            sanitized.append(_sanitize_list(cast(List[Any], item), depth - 1))
-        elif isinstance(item, (int, float, bool)):
-            sanitized.append(item)
-        elif item is None:
-            sanitized.append(None)
-        else:
-            sanitized.append(sanitize_string(str(item), MAX_METADATA_VALUE_LENGTH))
+    return [_sanitize_value(item, depth) for item in data]
 
-    return sanitized
+
+def _sanitize_value(value: Any, depth: int) -> Any:
+    """
+    Sanitize a single metadata value found at the given nesting depth.
+
+    Args:
+        value: Value to sanitize
+        depth: Nesting depth of the container holding value
+
+    Returns:
+        Sanitized value
+    """
+    # Exact-type checks first: metadata values are overwhelmingly plain
+    # built-in instances, which then skip the isinstance chain below
+    value_type = type(value)
+    if value_type is str:
+        return sanitize_string(value, MAX_METADATA_VALUE_LENGTH)
+    if value is None or value_type in _PASSTHROUGH_TYPES:
+        return value
+
+    if isinstance(value, str):
+        return sanitize_string(value, MAX_METADATA_VALUE_LENGTH)
+    if isinstance(value, dict):
+        return _sanitize_dict(cast(Dict[Any, Any], value), depth - 1)
+    if isinstance(value, list):
+        return _sanitize_list(cast(List[Any], value), depth - 1)
+    if isinstance(value, (int, float, bool)):
+        return value
+
+    # Convert unknown types to sanitized strings
+    return sanitize_string(str(value), MAX_METADATA_VALUE_LENGTH)
 
 
 @rate_limit_validation
@@ -389,7 +451,7 @@ def validate_url(url: str) -> bool:
         raise error
 
     # Check for dangerous URL schemes
-    if url.lower().startswith(('javascript:', 'vbscript:', 'data:')):
+    if DANGEROUS_URL_SCHEME_REGEX.match(url):
         error = SecurityValidationError(
             "Dangerous URL scheme detected",
             field="scheme",
@@ -518,7 +580,7 @@ def validate_and_sanitize_node_data(data: Dict[str, Any]) -> Dict[str, Any]:
 
         # Copy other fields with basic validation
         for key, value in data.items():
-            if key not in ["name", "label", "description", "meta"]:
+            if key not in _NODE_DATA_VALIDATED_FIELDS:
                 if isinstance(value, str):
                     sanitized[key] = sanitize_string(value)
                 else:
@@ -564,7 +626,11 @@ def get_validation_rate_limit_status(caller_id: Optional[str] = None) -> Dict[st
         caller_id = _current_caller_context or 'direct_call'
     
     current_time = time.time()
-    caller_requests = validation_rate_storage[caller_id]
+    # Look up without the defaultdict insert so status queries for unknown
+    # callers don't grow the rate limit storage
+    caller_requests = validation_rate_storage.get(caller_id)
+    if caller_requests is None:
+        caller_requests = deque()
     
     # Clean old entries
     while caller_requests and current_time - caller_requests[0] > VALIDATION_RATE_WINDOW:
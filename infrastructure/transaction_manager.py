@@ -66,7 +66,7 @@ class Transaction:
             rollback_function=rollback_function
         )
         self.operations.append(operation)
-        logger.debug(f"Added operation {operation_type} to transaction {self.transaction_id}")
+        logger.debug("Added operation %s to transaction %s", operation_type, self.transaction_id)
         return operation.operation_id
     
     def duration(self) -> float:
@@ -106,20 +106,20 @@ class TransactionManager:
         old_transaction = self._current_transaction
         self._current_transaction = transaction
         
-        logger.info(f"Starting transaction {transaction.transaction_id}")
+        logger.info("Starting transaction %s", transaction.transaction_id)
         
         try:
             yield self
             
             # If we reach here, commit the transaction
             self._commit_transaction(transaction)
-            logger.info(f"Transaction {transaction.transaction_id} committed successfully")
+            logger.info("Transaction %s committed successfully", transaction.transaction_id)
             
         except Exception as e:
             # Rollback on any exception
             transaction.error = e
             self._rollback_transaction(transaction)
-            logger.error(f"Transaction {transaction.transaction_id} failed and rolled back: {e}")
+            logger.error("Transaction %s failed and rolled back: %s", transaction.transaction_id, e)
             raise
             
         finally:
@@ -158,8 +158,8 @@ class TransactionManager:
     def _commit_transaction(self, transaction: Transaction):
         """Commit a transaction."""
         transaction.status = TransactionStatus.COMMITTED
-        logger.debug(f"Committed transaction {transaction.transaction_id} "
-                    f"with {len(transaction.operations)} operations")
+        logger.debug("Committed transaction %s with %d operations",
+                     transaction.transaction_id, len(transaction.operations))
     
     def _rollback_transaction(self, transaction: Transaction):
         """Rollback a transaction by reversing operations."""
@@ -169,15 +169,15 @@ class TransactionManager:
         for operation in reversed(transaction.operations):
             try:
                 if operation.rollback_function:
-                    logger.debug(f"Rolling back operation {operation.operation_type}")
+                    logger.debug("Rolling back operation %s", operation.operation_type)
                     operation.rollback_function(operation.rollback_data)
                 else:
-                    logger.warning(f"No rollback function for operation {operation.operation_type}")
+                    logger.warning("No rollback function for operation %s", operation.operation_type)
             except Exception as rollback_error:
-                logger.error(f"Rollback failed for operation {operation.operation_type}: {rollback_error}")
+                logger.error("Rollback failed for operation %s: %s", operation.operation_type, rollback_error)
                 # Continue with other rollbacks even if one fails
         
-        logger.info(f"Rolled back transaction {transaction.transaction_id}")
+        logger.info("Rolled back transaction %s", transaction.transaction_id)
     
     def get_transaction_stats(self) -> Dict[str, Any]:
         """Get transaction statistics."""
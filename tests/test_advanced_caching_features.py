@@ -195,7 +195,43 @@ class TestCacheDecorators(unittest.TestCase):
         result2 = expensive_function(5)
         self.assertEqual(result2, 10)
         self.assertEqual(call_count, 1)  # Function not called again
-    
+
+    def test_cached_decorator_without_cache_instance(self):
+        """Test that the default cache persists between calls."""
+        call_count = 0
+
+        @cached(ttl=300)
+        def square(x: int) -> int:
+            nonlocal call_count
+            call_count += 1
+            return x * x
+
+        self.assertEqual(square(4), 16)
+        self.assertEqual(square(4), 16)
+        self.assertEqual(call_count, 1)
+
+        square._cache_invalidate()  # pylint: disable=protected-access
+        self.assertEqual(square(4), 16)
+        self.assertEqual(call_count, 2)
+
+    def test_cached_decorator_default_cache_expires(self):
+        """Test that entries in the default cache expire after their ttl."""
+        call_count = 0
+
+        @cached(ttl=0.05)
+        def square(x: int) -> int:
+            nonlocal call_count
+            call_count += 1
+            return x * x
+
+        self.assertEqual(square(3), 9)
+        self.assertEqual(square(3), 9)
+        self.assertEqual(call_count, 1)
+
+        time.sleep(0.1)
+        self.assertEqual(square(3), 9)
+        self.assertEqual(call_count, 2)
+
     def test_cached_decorator_with_custom_key_function(self):
         """Test cached decorator with custom key function."""
         def custom_key_func(x: int, y: int) -> str:
@@ -283,6 +319,38 @@ class TestCacheConfiguration(unittest.TestCase):
         self.assertEqual(new_config.ttl, 600)
         self.assertEqual(new_config.max_size, 2000)
 
+    def test_cache_config_manager_layer_config_refreshes_after_update(self):
+        """Test that cached layer configs are rebuilt after an update."""
+        config_manager = CacheConfigManager()
+
+        first = config_manager.get_layer_config("query_cache")
+        self.assertIs(config_manager.get_layer_config("query_cache"), first)
+
+        config_manager.update_config({
+            "query_cache": {"backend": "memory", "ttl": 60, "max_size": 10}
+        })
+        updated = config_manager.get_layer_config("query_cache")
+        self.assertEqual(updated.ttl, 60)
+        self.assertEqual(updated.max_size, 10)
+
+    def test_cache_config_manager_isolated_from_nested_mutation(self):
+        """Test that nested edits outside update_config() cannot stale layer configs."""
+        updates = {"custom_cache": {"backend": "memory", "ttl": 120, "max_size": 50}}
+        config_manager = CacheConfigManager()
+        config_manager.update_config(updates)
+        self.assertEqual(config_manager.get_layer_config("custom_cache").ttl, 120)
+
+        updates["custom_cache"]["ttl"] = 1
+        config_manager.get_config()["custom_cache"]["ttl"] = 2
+        original_ttl = CACHE_CONFIG["query_cache"]["ttl"]
+        CACHE_CONFIG["query_cache"]["ttl"] = 3
+        try:
+            self.assertEqual(config_manager.get_config()["custom_cache"]["ttl"], 120)
+            self.assertEqual(config_manager.get_layer_config("custom_cache").ttl, 120)
+            self.assertEqual(config_manager.get_layer_config("query_cache").ttl, original_ttl)
+        finally:
+            CACHE_CONFIG["query_cache"]["ttl"] = original_ttl
+
 
 class TestCacheFactory(unittest.TestCase):
     """Test cache factory functionality."""
@@ -293,6 +293,28 @@ class TestMemoryManagementComponents(unittest.TestCase):
         self.assertEqual(stats.hits, 1)
         self.assertEqual(stats.misses, 1)
 
+    def test_memory_cache_lru_eviction(self):
+        """Test that the least recently read entry is evicted first."""
+        cache = MemoryCache("lru_cache", max_size=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+
+        cache.set("c", 3)
+
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(cache.get_stats().evicted, 1)
+
+    def test_ttl_cache_ignores_wall_clock_jumps(self):
+        """Test TTL expiry follows the monotonic clock, not wall-clock time."""
+        cache = TTLMemoryCache("ttl_cache", max_size=10, default_ttl=60)
+        cache.set("key1", "value1")
+
+        with patch("infrastructure.advanced_caching.time.time", return_value=time.time() + 3600):
+            self.assertEqual(cache.get("key1"), "value1")
+
     def test_ttl_cache_expiration(self):
         """Test TTL cache expiration."""
         cache = TTLMemoryCache("ttl_cache", max_size=10, default_ttl=0.1)  # 100ms TTL
@@ -336,6 +358,19 @@ class TestMemoryManagementComponents(unittest.TestCase):
         result = query_cache.get_cached_result("test_operation", node_id="123")
         self.assertIsNone(result)
 
+    def test_query_cache_default_key_generation(self):
+        """Test default cache keys use entity ids and sorted keyword arguments."""
+        query_cache = QueryCache()
+        actor = Actor(label="Key Actor")
+
+        key = query_cache._generate_cache_key(  # pylint: disable=protected-access
+            "op", actor, 5, limit=10, entity=actor
+        )
+        self.assertEqual(key, f"op:{actor.id}:5:entity:{actor.id}:limit:10")
+        self.assertEqual(
+            query_cache._generate_cache_key("op"), "op"  # pylint: disable=protected-access
+        )
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
\ No newline at end of file
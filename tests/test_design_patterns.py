@@ -18,6 +18,9 @@ from utils.patterns.command import (
 )
 from utils.patterns.strategy import (
     CentralityStrategy, BetweennessCentralityStrategy, EigenvectorCentralityStrategy,
+    ClosenessCentralityStrategy, DegreeCentralityStrategy,
+    LouvainCommunityStrategy, LabelPropagationCommunityStrategy,
+    GreedyModularityCommunityStrategy, ShortestPathStrategy, AllShortestPathsStrategy,
     StrategyManager, CentralityAnalyzer
 )
 from utils.patterns.decorator import (
@@ -27,6 +30,9 @@ from utils.patterns.decorator import (
 from utils.patterns.event_bus import (
     Event, EventHandler, EventBus, LoggingEventHandler, MetricsEventHandler
 )
+from utils.patterns.plugin import (
+    PluginManager, PluginRegistry, PluginStatus, get_global_plugin_manager
+)
 from utils.patterns.dependency_injection import (
     DIContainer, LifecycleType, ServiceScope, InjectionError, CircularDependencyError
 )
@@ -273,6 +279,200 @@ class TestStrategyPattern:
         assert len(all_centralities) == 3
         assert all(isinstance(score, float) for score in all_centralities.values())
     
+    def test_betweenness_matches_networkx(self):
+        """Test that betweenness matches NetworkX for directed multigraphs."""
+        import networkx as nx
+        
+        base = nx.gnm_random_graph(20, 45, seed=7, directed=True)
+        graph = nx.MultiDiGraph(nx.relabel_nodes(base, {n: uuid.uuid4() for n in base}))
+        graph.add_edges_from(list(graph.edges())[:5])
+        
+        expected = nx.betweenness_centrality(graph)
+        actual = BetweennessCentralityStrategy().calculate_all(graph)
+        assert actual == pytest.approx(expected)
+    
+    @pytest.mark.parametrize("use_scipy", [True, False])
+    def test_eigenvector_matches_power_iteration(self, use_scipy, monkeypatch):
+        """Test that eigenvector scores agree with NetworkX's power iteration."""
+        import networkx as nx
+        from utils.patterns import strategy as strategy_module
+        
+        monkeypatch.setattr(strategy_module, "SCIPY_AVAILABLE",
+                            use_scipy and strategy_module.SCIPY_AVAILABLE)
+        base = nx.gnm_random_graph(25, 80, seed=5)
+        graph = nx.MultiGraph(nx.relabel_nodes(base, {n: uuid.uuid4() for n in base}))
+        graph.add_edges_from(list(graph.edges())[:5])
+        # Weights are ignored on both backends
+        for source, target in list(graph.edges())[10:15]:
+            graph.add_edge(source, target, weight=5.0)
+        
+        expected = nx.eigenvector_centrality(nx.Graph(graph), max_iter=1000, weight=None)
+        actual = EigenvectorCentralityStrategy().calculate_all(graph)
+        assert actual == pytest.approx(expected, abs=1e-4)
+    
+    def test_parallel_betweenness_matches_networkx(self, monkeypatch):
+        """Test that the process-parallel betweenness fallback matches NetworkX."""
+        import networkx as nx
+        from utils.patterns import strategy as strategy_module
+        
+        monkeypatch.setattr(strategy_module, "IGRAPH_AVAILABLE", False)
+        base = nx.gnm_random_graph(30, 70, seed=3)
+        graph = nx.relabel_nodes(base, {n: uuid.uuid4() for n in base})
+        
+        strategy = BetweennessCentralityStrategy(max_workers=2, parallel_threshold=10)
+        assert strategy.calculate_all(graph) == pytest.approx(nx.betweenness_centrality(graph))
+    
+    def test_centrality_scores_follow_graph_changes(self):
+        """Test that scores reflect rewiring that keeps node and edge counts."""
+        import networkx as nx
+        
+        graph = nx.path_graph(4)
+        strategy = BetweennessCentralityStrategy()
+        assert strategy.calculate(graph, 1) == pytest.approx(2 / 3)
+        
+        graph.remove_edge(1, 2)
+        graph.add_edge(0, 3)
+        assert strategy.calculate(graph, 1) == pytest.approx(nx.betweenness_centrality(graph)[1])
+        assert strategy.calculate_all(graph) == pytest.approx(nx.betweenness_centrality(graph))
+    
+    @pytest.mark.parametrize("use_igraph, use_numpy", [(True, True), (True, False), (False, False)])
+    def test_community_strategies(self, use_igraph, use_numpy, monkeypatch):
+        """Test that community strategies separate two disconnected cliques."""
+        import networkx as nx
+        from utils.patterns import strategy as strategy_module
+        
+        monkeypatch.setattr(strategy_module, "IGRAPH_AVAILABLE",
+                            use_igraph and strategy_module.IGRAPH_AVAILABLE)
+        monkeypatch.setattr(strategy_module, "NUMPY_AVAILABLE",
+                            use_numpy and strategy_module.NUMPY_AVAILABLE)
+        first = [uuid.uuid4() for _ in range(4)]
+        second = [uuid.uuid4() for _ in range(4)]
+        graph = nx.MultiDiGraph()
+        graph.add_edges_from((u, v) for u in first for v in first if u != v)
+        graph.add_edges_from((u, v) for u in second for v in second if u != v)
+        
+        for strategy in (LouvainCommunityStrategy(), LabelPropagationCommunityStrategy(),
+                         GreedyModularityCommunityStrategy()):
+            communities = strategy.execute(graph)
+            assert {frozenset(members) for members in communities.values()} == {
+                frozenset(first), frozenset(second)
+            }
+        
+        assert LouvainCommunityStrategy().execute(nx.Graph()) == {}
+    
+    def test_igraph_communities_follow_graph_changes(self):
+        """Test that igraph-backed strategies see rewiring that keeps graph size."""
+        import networkx as nx
+        from utils.patterns import strategy as strategy_module
+        
+        if not strategy_module.IGRAPH_AVAILABLE:
+            pytest.skip("igraph not installed")
+        
+        graph = nx.Graph([(0, 1), (0, 2), (1, 2), (3, 4), (3, 5), (4, 5)])
+        graph.add_node(6)
+        communities = LouvainCommunityStrategy().execute(graph)
+        assert {frozenset(members) for members in communities.values()} == {
+            frozenset({0, 1, 2}), frozenset({3, 4, 5}), frozenset({6})
+        }
+        
+        # Move node 2's triangle edges to node 6
+        graph.remove_edges_from([(0, 2), (1, 2)])
+        graph.add_edges_from([(0, 6), (1, 6)])
+        communities = LouvainCommunityStrategy().execute(graph)
+        assert {frozenset(members) for members in communities.values()} == {
+            frozenset({0, 1, 6}), frozenset({3, 4, 5}), frozenset({2})
+        }
+    
+    def test_igraph_communities_match_networkx_semantics(self, caplog):
+        """Test igraph-backed strategies handle weights the way the NetworkX paths do."""
+        import networkx as nx
+        from utils.patterns import strategy as strategy_module
+        
+        if not strategy_module.IGRAPH_AVAILABLE:
+            pytest.skip("igraph not installed")
+        
+        first, second = list(range(4)), list(range(4, 8))
+        graph = nx.Graph()
+        graph.add_edges_from((u, v) for u in first for v in first if u < v)
+        graph.add_edges_from((u, v) for u in second for v in second if u < v)
+        expected = {frozenset(first), frozenset(second)}
+        
+        # igraph rejects negative weights; Louvain falls back to NetworkX
+        graph.add_edge(0, 4, weight=-1.0)
+        communities = LouvainCommunityStrategy().execute(graph)
+        assert {frozenset(members) for members in communities.values()} == expected
+        assert "falling back to NetworkX" in caplog.text
+        
+        # Label propagation and greedy modularity run unweighted
+        graph.add_edge(0, 4, weight="heavy")
+        for strategy in (LabelPropagationCommunityStrategy(), GreedyModularityCommunityStrategy()):
+            communities = strategy.execute(graph)
+            assert {frozenset(members) for members in communities.values()} == expected
+        
+        # Reciprocal directed edges are not summed into one heavier edge
+        directed = nx.DiGraph([("a", "b", {"weight": 1.0}), ("b", "a", {"weight": 1.0}),
+                               ("b", "c", {"weight": 3.0})])
+        converted, _ = strategy_module._to_igraph(directed)
+        assert not converted.is_directed()
+        assert sorted(converted.es["weight"]) == [1.0, 3.0]
+    
+    def test_graph_fingerprint(self):
+        """Test the graph fingerprint tracks structure and edge weights."""
+        import networkx as nx
+        from utils.patterns import strategy as strategy_module
+        
+        graph = nx.MultiDiGraph()
+        graph.add_edge("a", "b")
+        assert strategy_module._graph_fingerprint(graph) == (True, True, False, 2)
+        
+        # Weighting an existing edge changes neither node nor edge count
+        graph.edges["a", "b", 0]["weight"] = 2.0
+        assert strategy_module._graph_fingerprint(graph).weighted
+        graph.add_edge("b", "c", weight=2.0)
+        
+        if strategy_module.IGRAPH_AVAILABLE:
+            plain, _ = strategy_module._to_igraph(nx.path_graph(4))
+            merged, _ = strategy_module._to_igraph(graph)
+            assert not plain.is_weighted()
+            assert merged.is_weighted()
+    
+    def test_path_finding_strategies(self):
+        """Test shortest path strategies against NetworkX."""
+        import networkx as nx
+        
+        grid = nx.grid_2d_graph(3, 3)
+        graph = nx.relabel_nodes(grid, {n: uuid.uuid4() for n in grid})
+        nodes = list(graph.nodes())
+        source, target = nodes[0], nodes[-1]
+        expected = sorted(map(tuple, nx.all_shortest_paths(graph, source, target)))
+        
+        all_paths = AllShortestPathsStrategy().execute(graph, source, target)
+        assert sorted(map(tuple, all_paths)) == expected
+        assert tuple(ShortestPathStrategy().execute(graph, source, target)) in expected
+        assert AllShortestPathsStrategy().find_all_paths(graph, source, source) == [[source]]
+        
+        lazy_paths = AllShortestPathsStrategy().iter_all_paths(graph, source, target)
+        assert tuple(next(lazy_paths)) in expected
+        
+        # Unknown and unreachable nodes yield no path
+        graph.add_node(uuid.uuid4())
+        isolated = list(graph.nodes())[-1]
+        assert ShortestPathStrategy().find_path(graph, source, isolated) is None
+        assert AllShortestPathsStrategy().find_all_paths(graph, uuid.uuid4(), target) == []
+        assert list(AllShortestPathsStrategy().iter_all_paths(graph, source, isolated)) == []
+    
+    def test_path_finding_after_rewiring(self):
+        """Test paths reflect an edge rewire that keeps node and edge counts."""
+        import networkx as nx
+        
+        graph = nx.path_graph(4)
+        assert ShortestPathStrategy().find_path(graph, 0, 3) == [0, 1, 2, 3]
+        
+        graph.remove_edge(1, 2)
+        graph.add_edge(0, 3)
+        assert ShortestPathStrategy().find_path(graph, 0, 3) == [0, 3]
+        assert AllShortestPathsStrategy().find_all_paths(graph, 0, 3) == [[0, 3]]
+    
     def test_strategy_manager(self):
         """Test strategy manager functionality."""
         manager = StrategyManager()
@@ -291,6 +491,58 @@ class TestStrategyPattern:
         default_strategy = manager.get_default_strategy("centrality")
         assert default_strategy == "betweenness"
     
+    def test_default_strategies_instantiated_lazily(self):
+        """Test that default strategies are created on first use and reused."""
+        manager = StrategyManager()
+        assert manager._strategies == {}
+        assert manager.get_statistics()["total_strategies"] == 9
+        
+        strategy = manager.get_strategy("pathfinding")
+        assert isinstance(strategy, ShortestPathStrategy)
+        assert manager.get_strategy("pathfinding", "shortest_path") is strategy
+        assert list(manager._strategies) == [("pathfinding", "shortest_path")]
+        
+        # Replacing a pending factory with an instance keeps a single listing
+        replacement = BetweennessCentralityStrategy(max_workers=2)
+        manager.register_strategy("centrality", replacement)
+        assert manager.get_strategy("centrality") is replacement
+        assert manager.list_strategies("centrality")["centrality"].count("betweenness") == 1
+    
+    def test_strategy_manager_removal(self):
+        """Test removing and clearing strategies keeps lookups consistent."""
+        manager = StrategyManager()
+        
+        assert manager.get_strategy_metadata("centrality", "betweenness").strategy_type == "centrality"
+        assert manager.remove_strategy("centrality", "betweenness")
+        assert not manager.remove_strategy("centrality", "betweenness")
+        assert manager.get_strategy_metadata("centrality", "betweenness") is None
+        assert manager.get_default_strategy("centrality") == "closeness"
+        assert "betweenness" not in manager.list_strategies("centrality")["centrality"]
+        
+        manager.clear_strategies("community")
+        assert "community" not in manager.get_categories()
+        assert manager.get_strategy("community") is None
+        assert manager.get_statistics()["total_strategies"] == 5
+    
+    def test_default_strategy_cache_invalidation(self):
+        """Test the cached default strategy follows registry changes."""
+        manager = StrategyManager()
+        
+        assert isinstance(manager.get_strategy("centrality"), BetweennessCentralityStrategy)
+        manager.set_default_strategy("centrality", "degree")
+        assert isinstance(manager.get_strategy("centrality"), DegreeCentralityStrategy)
+        
+        replacement = ClosenessCentralityStrategy()
+        manager.set_default_strategy("centrality", "closeness")
+        manager.register_strategy("centrality", replacement)
+        assert manager.get_strategy("centrality") is replacement
+        assert manager.get_executor("centrality") == replacement.execute
+        
+        manager.remove_strategy("centrality", "closeness")
+        assert isinstance(manager.get_strategy("centrality"), BetweennessCentralityStrategy)
+        with pytest.raises(ValueError):
+            manager.get_executor("centrality", "missing")
+    
     def test_centrality_analyzer(self):
         """Test centrality analyzer functionality."""
         import networkx as nx
@@ -317,6 +569,23 @@ class TestStrategyPattern:
         strategies = analyzer.get_available_strategies()
         assert "betweenness" in strategies
         assert "closeness" in strategies
+    
+    def test_compare_centralities_for_nodes(self):
+        """Test bulk comparison agrees with per-node comparison."""
+        import networkx as nx
+        
+        analyzer = CentralityAnalyzer()
+        graph = nx.path_graph([uuid.uuid4() for _ in range(5)])
+        nodes = list(graph.nodes())
+        
+        bulk = analyzer.compare_centralities_for_nodes(graph, nodes[:3], ["betweenness", "degree", "unknown"])
+        
+        assert set(bulk) == set(nodes[:3])
+        for node_id in nodes[:3]:
+            single = analyzer.compare_centralities(graph, node_id, ["betweenness", "degree"])
+            assert bulk[node_id]["betweenness"] == pytest.approx(single["betweenness"])
+            assert bulk[node_id]["degree"] == pytest.approx(single["degree"])
+            assert bulk[node_id]["unknown"].startswith("Error:")
 
 
 class TestDecoratorPattern:
@@ -476,6 +745,208 @@ class TestEventBus:
         assert history[1].event_type == "event2"
 
 
+class TestPluginArchitecture:
+    """Test the Plugin architecture implementation."""
+    
+    PLUGIN_SOURCE = """
+from utils.patterns.plugin import SFMPlugin, PluginMetadata
+
+
+class ExamplePlugin(SFMPlugin):
+    def get_metadata(self):
+        return PluginMetadata(
+            name="example", version="1.0.0",
+            description="Example plugin", author="tests"
+        )
+
+    def initialize(self, framework_context):
+        pass
+
+    def cleanup(self):
+        pass
+
+    def register_analyzers(self):
+        return {"example_analyzer": lambda graph: graph}
+"""
+    
+    def _write_plugin(self, tmp_path, name="plugin_example"):
+        plugin_file = tmp_path / f"{name}.py"
+        plugin_file.write_text(self.PLUGIN_SOURCE)
+        return plugin_file
+    
+    def test_plugin_lifecycle_status_index(self, tmp_path):
+        """Test that status queries track plugin lifecycle transitions."""
+        manager = PluginManager()
+        plugin_file = self._write_plugin(tmp_path)
+        
+        assert manager.load_plugin("plugin_example", plugin_file)
+        assert [p.metadata.name for p in manager.list_plugins(PluginStatus.LOADED)] == ["example"]
+        
+        assert manager.activate_plugin("plugin_example")
+        registry = manager.get_plugin_registry()
+        assert registry.get_plugin_resources("plugin_example")["analyzers"] == ["example_analyzer"]
+        assert manager.list_plugins(PluginStatus.LOADED) == []
+        assert len(manager.list_plugins(PluginStatus.ACTIVATED)) == 1
+        assert manager._check_dependencies(["plugin_example"])
+        assert not manager._check_dependencies(["plugin_missing"])
+        
+        assert manager.deactivate_plugin("plugin_example")
+        assert registry.get_analyzer("example_analyzer") is None
+        stats = manager.get_statistics()
+        assert stats["status_counts"]["deactivated"] == 1
+        assert stats["status_counts"]["activated"] == 0
+        
+        assert manager.unload_plugin("plugin_example")
+        assert manager.get_statistics()["status_counts"]["deactivated"] == 0
+    
+    def test_list_plugins_by_status_keeps_load_order(self, tmp_path):
+        """Test that status-filtered listings follow plugin load order."""
+        manager = PluginManager()
+        names = [f"plugin_order_{i}" for i in range(8)]
+        for name in names:
+            # Distinct analyzer names so every plugin can be activated
+            plugin_file = tmp_path / f"{name}.py"
+            plugin_file.write_text(self.PLUGIN_SOURCE.replace("example_analyzer", f"{name}_analyzer"))
+            assert manager.load_plugin(name, plugin_file)
+        
+        loaded = manager.list_plugins(PluginStatus.LOADED)
+        assert loaded == [manager.get_plugin_info(name) for name in names]
+        assert loaded == manager.list_plugins()
+        
+        # Listings keep load order, not the order plugins changed status
+        for name in reversed(names[:3]):
+            assert manager.activate_plugin(name)
+        assert manager.list_plugins(PluginStatus.ACTIVATED) == [
+            manager.get_plugin_info(name) for name in names[:3]
+        ]
+    
+    def test_load_skips_abstract_plugin_classes(self, tmp_path):
+        """Test that abstract intermediate plugin classes are not instantiated."""
+        plugin_file = tmp_path / "plugin_layered.py"
+        plugin_file.write_text("""
+from abc import abstractmethod
+from utils.patterns.plugin import SFMPlugin, PluginMetadata
+
+
+class BaseLayeredPlugin(SFMPlugin):
+    @abstractmethod
+    def layer(self):
+        pass
+
+
+class LayeredPlugin(BaseLayeredPlugin):
+    def get_metadata(self):
+        return PluginMetadata(
+            name="layered", version="1.0.0",
+            description="Layered plugin", author="tests"
+        )
+
+    def initialize(self, framework_context):
+        pass
+
+    def cleanup(self):
+        pass
+
+    def layer(self):
+        return "concrete"
+""")
+        
+        manager = PluginManager()
+        assert manager.load_plugin("plugin_layered", plugin_file)
+        plugin = manager.get_plugin_info("plugin_layered").plugin_instance
+        assert plugin.layer() == "concrete"
+    
+    def test_load_plugin_with_prerelease_framework_version(self, tmp_path):
+        """Test that non-numeric framework versions do not fail the load."""
+        plugin_file = tmp_path / "plugin_beta.py"
+        plugin_file.write_text(self.PLUGIN_SOURCE.replace(
+            'author="tests"', 'author="tests", min_framework_version="1.0.0-beta",'
+            ' max_framework_version="2.0rc1"'
+        ))
+    
+        manager = PluginManager()
+        assert manager.load_plugin("plugin_beta", plugin_file)
+        assert manager.get_plugin_info("plugin_beta").status == PluginStatus.LOADED
+    
+    def test_discover_plugins(self, tmp_path):
+        """Test that only plugin_*.py files are discovered."""
+        self._write_plugin(tmp_path)
+        (tmp_path / "helpers.py").write_text("")
+        (tmp_path / "plugin_notes.txt").write_text("")
+        
+        manager = PluginManager()
+        manager.add_plugin_directory(tmp_path)
+        
+        assert manager.discover_plugins() == ["plugin_example"]
+    
+    def test_registry_rejects_duplicates(self):
+        """Test that registering the same resource twice is rejected."""
+        registry = PluginRegistry()
+        registry.register_validator("check", lambda value: True, "plugin_a")
+        
+        with pytest.raises(ValueError, match="Validator check already registered"):
+            registry.register_validator("check", lambda value: False, "plugin_b")
+        
+        registry.unregister_plugin_resources("plugin_a")
+        assert registry.get_registered_resources()["validators"] == []
+    
+    def test_batch_registration_is_atomic(self):
+        """Test that a conflicting batch registers none of its resources."""
+        registry = PluginRegistry()
+        registry.register_analyzer("shared", lambda graph: graph, "plugin_a")
+        
+        with pytest.raises(ValueError, match="Analyzer shared already registered"):
+            registry.register_from_plugin(
+                "plugin_b",
+                validators={"check": lambda value: True},
+                analyzers={"shared": lambda graph: None}
+            )
+        
+        assert registry.get_validator("check") is None
+        assert registry.get_plugin_resources("plugin_b")["validators"] == []
+        
+        registry.register_from_plugin("plugin_b", validators={"check": lambda value: True})
+        assert registry.get_plugin_resources("plugin_b")["validators"] == ["check"]
+    
+    def test_global_plugin_manager_singleton(self):
+        """Test that the global plugin manager is created once and reused."""
+        assert get_global_plugin_manager() is get_global_plugin_manager()
+    
+    def test_failed_plugin_load(self, tmp_path):
+        """Test that a failed load is recorded with error status."""
+        manager = PluginManager()
+        
+        assert not manager.load_plugin("plugin_missing", tmp_path / "plugin_missing.py")
+        assert len(manager.list_plugins(PluginStatus.ERROR)) == 1
+    
+    def test_failed_import_is_cached(self, tmp_path):
+        """Test that a failed import is not retried until the cache is cleared."""
+        manager = PluginManager()
+        plugin_file = tmp_path / "plugin_example.py"
+        
+        assert not manager.load_plugin("plugin_example", plugin_file)
+        error_message = manager.get_plugin_info("plugin_example").error_message
+        
+        # The file now exists, but the cached failure short-circuits the import
+        self._write_plugin(tmp_path)
+        manager.unload_plugin("plugin_example")
+        assert not manager.load_plugin("plugin_example", plugin_file)
+        assert manager.get_plugin_info("plugin_example").error_message == error_message
+        
+        manager.unload_plugin("plugin_example")
+        manager.clear_failed_imports("plugin_example")
+        assert manager.load_plugin("plugin_example", plugin_file)
+    
+    def test_load_plugin_when_module_name_is_imported(self, tmp_path, monkeypatch):
+        """Test that a file plugin loads even if its name is already in sys.modules."""
+        import sys
+        import types
+        
+        monkeypatch.setitem(sys.modules, "plugin_example", types.ModuleType("plugin_example"))
+        manager = PluginManager()
+        assert manager.load_plugin("plugin_example", self._write_plugin(tmp_path))
+
+
 class TestDependencyInjection:
     """Test the Dependency Injection implementation."""
     
@@ -145,6 +145,10 @@ class TestAuditLogging(unittest.TestCase):
         # Should have more audit events
         self.assertGreater(final_stats["total_events"], initial_stats["total_events"])
 
+    def test_global_audit_logger_is_shared(self):
+        """Test that the lazily created global audit logger is reused."""
+        self.assertIs(get_audit_logger(), self.audit_logger)
+
     def test_audit_metrics(self):
         """Test audit metrics collection."""
         metrics = self.service.get_audit_metrics()
@@ -0,0 +1,71 @@
+"""
+Tests for structured log record serialization.
+"""
+
+import json
+import unittest
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from unittest.mock import patch
+
+from infrastructure import logging_config
+from infrastructure.logging_config import _dumps_log_record
+
+
+class _Level(Enum):
+    HIGH = "high"
+
+
+@dataclass
+class _Point:
+    x: int
+    y: int
+
+
+class _Opaque:
+    def __str__(self) -> str:
+        return "opaque"
+
+
+class TestDumpsLogRecord(unittest.TestCase):
+    """Test that both JSON backends produce the same log lines."""
+
+    def setUp(self):
+        self.record = {
+            "timestamp": datetime(2024, 1, 2, 3, 4, 5, 678901),
+            "correlation_id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            "level": _Level.HIGH,
+            "point": _Point(1, 2),
+            "message": "café",
+            "metadata": {"count": 3, "tags": ["a", "b"]},
+        }
+        self.expected = (
+            '{"timestamp":"2024-01-02T03:04:05.678901",'
+            '"correlation_id":"12345678-1234-5678-1234-567812345678",'
+            '"level":"high","point":{"x":1,"y":2},"message":"café",'
+            '"metadata":{"count":3,"tags":["a","b"]}}'
+        )
+
+    def test_stdlib_fallback(self):
+        """Test the stdlib encoder handles the types orjson accepts."""
+        with patch.object(logging_config, "ORJSON_AVAILABLE", False):
+            self.assertEqual(_dumps_log_record(self.record), self.expected)
+
+    @unittest.skipUnless(logging_config.ORJSON_AVAILABLE, "orjson not installed")
+    def test_orjson_backend(self):
+        """Test orjson output matches the stdlib fallback."""
+        self.assertEqual(_dumps_log_record(self.record), self.expected)
+
+    def test_unsupported_values_fall_back_to_str(self):
+        """Test values neither encoder knows are logged via str()."""
+        record = {"value": _Opaque(), "big": 2 ** 70}
+        for orjson_available in {False, logging_config.ORJSON_AVAILABLE}:
+            with patch.object(logging_config, "ORJSON_AVAILABLE", orjson_available):
+                line = _dumps_log_record(record)
+                self.assertEqual(json.loads(line), {"value": "opaque", "big": 2 ** 70})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+"""
+Tests for request metric endpoint labels.
+"""
+
+import unittest
+from types import SimpleNamespace
+
+from infrastructure.metrics import UNMATCHED_ENDPOINT, endpoint_label
+
+
+class TestEndpointLabel(unittest.TestCase):
+    """Test that endpoint labels come from route templates."""
+
+    def test_matched_route_uses_template(self):
+        """Test requests are labelled by the template of the matched route."""
+        scope = {"path": "/actors/42", "route": SimpleNamespace(path="/actors/{actor_id}")}
+        self.assertEqual(endpoint_label(scope, 200), "/actors/{actor_id}")
+        self.assertEqual(endpoint_label(scope, 500), "/actors/{actor_id}")
+        self.assertEqual(endpoint_label(scope), "/actors/{actor_id}")
+
+    def test_unmatched_and_not_found_share_one_label(self):
+        """Test unrouted and 404 requests fall into the fixed bucket."""
+        self.assertEqual(endpoint_label({"path": "/wp-login.php"}, 404), UNMATCHED_ENDPOINT)
+        self.assertEqual(endpoint_label({"path": "/a1b2c3d4"}), UNMATCHED_ENDPOINT)
+        self.assertEqual(endpoint_label({"path": "/x", "route": SimpleNamespace()}), UNMATCHED_ENDPOINT)
+
+        scope = {"path": "/actors/42", "route": SimpleNamespace(path="/actors/{actor_id}")}
+        self.assertEqual(endpoint_label(scope, 404), UNMATCHED_ENDPOINT)
+
+
+if __name__ == "__main__":
+    unittest.main()
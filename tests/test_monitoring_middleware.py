@@ -0,0 +1,109 @@
+"""
+Tests for the request monitoring middleware.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+pytest.importorskip("starlette")
+pytest.importorskip("httpx")
+
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from infrastructure.monitoring_middleware import MetricsMiddleware, MonitoringMiddleware
+
+
+async def _items(request):
+    return PlainTextResponse("ok", headers={"X-Correlation-ID": "set-by-app"})
+
+
+@pytest.fixture
+def client():
+    app = Starlette(routes=[Route("/items", _items)])
+    app.add_middleware(MonitoringMiddleware)
+    return TestClient(app)
+
+
+class TestCorrelationIdHeader:
+    """Test the correlation ID response header."""
+
+    def test_incoming_id_replaces_app_header(self, client):
+        """Test the request's correlation ID is echoed once."""
+        response = client.get("/items", headers={"X-Correlation-ID": "abc-123"})
+        assert response.headers.get_list("x-correlation-id") == ["abc-123"]
+
+    def test_generated_id_when_missing(self, client):
+        """Test a correlation ID is generated when the request has none."""
+        response = client.get("/items")
+        correlation_ids = response.headers.get_list("x-correlation-id")
+        assert len(correlation_ids) == 1
+        assert correlation_ids[0] != "set-by-app"
+
+
+async def _actor(request):
+    return PlainTextResponse(request.path_params["actor_id"])
+
+
+def _with_monitoring(app):
+    app.add_middleware(MonitoringMiddleware)
+    return app
+
+
+class TestEndpointLabels:
+    """Test request metrics are labelled by route template."""
+
+    @pytest.mark.parametrize("wrap", [MetricsMiddleware, _with_monitoring])
+    def test_unknown_paths_share_one_label(self, wrap):
+        """Test entity URLs share their template and unknown paths add no labels."""
+        collector = Mock()
+        with patch("infrastructure.monitoring_middleware.get_metrics_collector",
+                   return_value=collector):
+            app = wrap(Starlette(routes=[Route("/actors/{actor_id}", _actor)]))
+            client = TestClient(app)
+            for path in ("/actors/1", "/actors/2", "/wp-login.php", "/random/a1b2c3", "/.env"):
+                client.get(path)
+
+        labels = [call.args[1] for call in collector.record_request.call_args_list]
+        assert labels == ["/actors/{actor_id}"] * 2 + ["other"] * 3
+
+
+class TestLevelGating:
+    """Test request and response logging is skipped for disabled levels."""
+
+    def setup_method(self):
+        self.middleware = MonitoringMiddleware(Starlette(), {"log_body": True})
+
+    def test_request_details_skipped_when_info_disabled(self):
+        """Test the body is not read when INFO records would be dropped."""
+        logger = Mock()
+        logger.is_enabled_for.return_value = False
+        request = Mock(method="POST")
+        request.body = AsyncMock(return_value=b"{}")
+
+        asyncio.run(self.middleware._log_request(request, logger))
+
+        logger.is_enabled_for.assert_called_once_with("INFO")
+        request.body.assert_not_awaited()
+        logger.info.assert_not_called()
+
+    @pytest.mark.parametrize("status_code, method", [
+        (200, "info"), (404, "warning"), (503, "error"),
+    ])
+    def test_response_logged_at_status_level(self, status_code, method):
+        """Test responses are logged only when their status level is enabled."""
+        response = Mock(status_code=status_code, headers={})
+
+        logger = Mock()
+        logger.is_enabled_for.return_value = False
+        asyncio.run(self.middleware._log_response(Mock(), response, 0.01, logger))
+        logger.is_enabled_for.assert_called_once_with(method.upper())
+        getattr(logger, method).assert_not_called()
+
+        logger.is_enabled_for.return_value = True
+        asyncio.run(self.middleware._log_response(Mock(), response, 0.01, logger))
+        getattr(logger, method).assert_called_once()
@@ -165,6 +165,33 @@ class TestPerformanceOptimizations(unittest.TestCase):
         updated_rels = self.graph.get_node_relationships(node_id)
         self.assertEqual(len(updated_rels), 2)
 
+    def test_adjacency_index_tracks_direct_relationship_edits(self):
+        """Test node relationship lookups stay correct after direct dict edits."""
+        rel = Relationship(
+            source_id=self.nodes[0].id,
+            target_id=self.nodes[1].id,
+            kind="AFFECTS"
+        )
+        self_loop = Relationship(
+            source_id=self.nodes[2].id,
+            target_id=self.nodes[2].id,
+            kind="AFFECTS"
+        )
+        self.graph.add_relationship(rel)
+        self.graph.add_relationship(self_loop)
+
+        self.assertEqual(self.graph.get_node_relationships(self.nodes[1].id), [rel])
+        self.assertEqual(self.graph.get_node_relationships(self.nodes[2].id), [self_loop])
+
+        # Bypass add_relationship, as the command and persistence layers do
+        extra = Relationship(
+            source_id=self.nodes[3].id,
+            target_id=self.nodes[0].id,
+            kind="AFFECTS"
+        )
+        self.graph.relationships[extra.id] = extra
+        self.assertEqual(self.graph.get_node_relationships(self.nodes[3].id), [extra])
+
     def test_lazy_loading_functionality(self):
         """Test lazy loading mechanism for nodes."""
         # Create a separate graph for lazy loading test
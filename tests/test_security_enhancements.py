@@ -7,10 +7,13 @@ This module tests the new security features added to the SFM framework:
 - Advanced input sanitization with bleach
 """
 
+import html
 import unittest
 import time
 from unittest.mock import patch, MagicMock
 
+import bleach
+
 from infrastructure.security_validators import (
     sanitize_string,
     validate_metadata,
@@ -24,6 +27,7 @@ from infrastructure.security_validators import (
     clear_validation_rate_limit_storage,
     VALIDATION_RATE_LIMIT,
     VALIDATION_RATE_WINDOW,
+    validation_rate_storage,
 )
 
 
@@ -117,6 +121,32 @@ class TestSecurityEnhancements(unittest.TestCase):
         # Should be HTML escaped since we're being strict
         self.assertIn("&lt;b&gt;", result)
 
+    def test_sanitization_results_are_memoised(self):
+        """Test that repeated strings are only cleaned by bleach once."""
+        value = "Memoised <i>label</i> 7f3c"
+        with patch('infrastructure.security_validators.bleach.clean',
+                   wraps=bleach.clean) as mock_clean:
+            first = sanitize_string(value)
+            second = sanitize_string(value)
+
+        self.assertEqual(first, second)
+        mock_clean.assert_called_once()
+
+    def test_plain_text_skips_bleach(self):
+        """Test that strings without markup bypass bleach with identical output."""
+        samples = ["Plain 'quoted' \"label\" 41d2", "Tabs\tand\nnewlines 41d2"]
+        with patch('infrastructure.security_validators.bleach.clean',
+                   wraps=bleach.clean) as mock_clean:
+            results = [sanitize_string(sample) for sample in samples]
+            mock_clean.assert_not_called()
+
+            # Markup and carriage returns still go through bleach
+            sanitize_string("a < b\r\n41d2")
+            mock_clean.assert_called_once()
+
+        for sample, result in zip(samples, results):
+            self.assertEqual(result, html.escape(bleach.clean(sample, strip=True), quote=True))
+
     def test_metadata_validation_with_dangerous_content(self):
         """Test metadata validation with dangerous content."""
         dangerous_metadata = {
@@ -190,6 +220,14 @@ class TestSecurityEnhancements(unittest.TestCase):
         self.assertEqual(status2["current_requests"], 10)
         self.assertEqual(status_current["current_requests"], 10)
 
+    def test_rate_limit_status_for_unknown_caller(self):
+        """Test that querying an unseen caller does not allocate storage for it."""
+        status = get_validation_rate_limit_status("never_seen")
+
+        self.assertEqual(status["current_requests"], 0)
+        self.assertEqual(status["remaining_requests"], VALIDATION_RATE_LIMIT)
+        self.assertNotIn("never_seen", validation_rate_storage)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -68,6 +68,11 @@ class TestSecurityValidators(unittest.TestCase):
         # Test eval calls
         with self.assertRaises(SecurityValidationError):
             sanitize_string("eval('malicious code')")
+        
+        # The error reports which pattern matched
+        with self.assertRaises(SecurityValidationError) as context:
+            sanitize_string("onclick=alert('xss')")
+        self.assertEqual(context.exception.context["pattern"], r'on\w+\s*=')
 
     def test_sanitize_string_length_limits(self):
         """Test string length validation."""
@@ -155,6 +160,10 @@ class TestSecurityValidators(unittest.TestCase):
         
         with self.assertRaises(SecurityValidationError):
             validate_url("data:text/html,<script>alert('xss')</script>")
+        
+        # Scheme matching ignores case
+        with self.assertRaises(SecurityValidationError):
+            validate_url("JavaScript:alert('xss')")
 
     def test_validate_node_label(self):
         """Test node label validation."""
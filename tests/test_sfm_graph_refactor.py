@@ -2,11 +2,15 @@
 Test cases for the refactored SFMGraph.add_node() method.
 """
 import unittest
+from unittest.mock import Mock
 from graph.graph import SFMGraph
 from models.core_nodes import Actor, Institution, Resource, Process, Flow, ValueFlow, Policy, GovernanceStructure
 from models.specialized_nodes import BeliefSystem, TechnologySystem, Indicator, FeedbackLoop, SystemProperty, AnalyticalContext, PolicyInstrument
 from models.behavioral_nodes import ValueSystem, CeremonialBehavior, InstrumentalBehavior, ChangeProcess, CognitiveFramework, BehavioralPattern
-from models.sfm_enums import ResourceType, InstitutionLayer, FlowNature
+from models.relationships import Relationship
+from models.sfm_enums import (
+    ResourceType, InstitutionLayer, FlowNature, RelationshipKind, IncompatibleEnumError
+)
 
 
 class TestSFMGraphRefactor(unittest.TestCase):
@@ -176,6 +180,56 @@ class TestSFMGraphRefactor(unittest.TestCase):
         self.assertEqual(len(self.graph.resources), 0)
         self.assertEqual(len(self.graph.belief_systems), 0)
 
+    def test_add_nodes_from(self):
+        """Test bulk node insertion routes nodes like add_node."""
+        actor = Actor(label="Bulk Actor")
+        policy = Policy(label="Bulk Policy")
+        value_flow = ValueFlow(label="Bulk Value Flow")
+        observer = Mock()
+        self.graph.add_observer(observer)
+        result = self.graph.add_nodes_from([actor, policy, value_flow])
+
+        self.assertEqual(result, [actor, policy, value_flow])
+        self.assertIn(actor.id, self.graph.actors)
+        self.assertIn(policy.id, self.graph.policies)
+        self.assertIn(value_flow.id, self.graph.value_flows)
+        self.assertIs(self.graph.get_node_by_id(policy.id), policy)
+        self.assertEqual(
+            [call.args[0] for call in observer.on_node_added.call_args_list],
+            [actor, policy, value_flow]
+        )
+
+    def test_add_nodes_from_rejects_batch_with_unsupported_node(self):
+        """Test that an unsupported node type leaves the graph unchanged."""
+        from models.base_nodes import Node
+
+        with self.assertRaises(TypeError):
+            self.graph.add_nodes_from([Actor(label="Valid"), Node(label="Generic Node")])
+        self.assertEqual(len(self.graph), 0)
+
+    def test_add_relationships_from(self):
+        """Test bulk relationship insertion validates before storing."""
+        actor = Actor(label="Employer")
+        worker = Actor(label="Worker")
+        resource = Resource(label="Land", rtype=ResourceType.NATURAL)
+        self.graph.add_nodes_from([actor, worker, resource])
+
+        employs = Relationship(source_id=actor.id, target_id=worker.id,
+                               kind=RelationshipKind.EMPLOYS)
+        governs = Relationship(source_id=actor.id, target_id=worker.id,
+                               kind=RelationshipKind.GOVERNS)
+        self.assertEqual(self.graph.add_relationships_from([employs, governs]), [employs, governs])
+        self.assertEqual(len(self.graph.get_node_relationships(worker.id)), 2)
+
+        invalid = Relationship(source_id=resource.id, target_id=actor.id,
+                               kind=RelationshipKind.GOVERNS)
+        extra = Relationship(source_id=worker.id, target_id=actor.id,
+                             kind=RelationshipKind.EMPLOYS)
+        with self.assertRaises(IncompatibleEnumError):
+            self.graph.add_relationships_from([extra, invalid])
+        self.assertNotIn(extra.id, self.graph.relationships)
+        self.assertEqual(len(self.graph.relationships), 2)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -2826,3 +2826,22 @@ class TestValidationRulesIntegration(unittest.TestCase):
         self.assertEqual(len(graph.validation_rules), 1)
         self.assertEqual(graph.validation_rules[0].target_field, "data_quality")
         self.assertEqual(graph.validation_rules[0].error_message, "Data quality must be >= 0.7")
+
+
+class TestCompatibilityLayer(unittest.TestCase):
+    """Tests for the lazy re-exports in core/sfm_models.py."""
+
+    def test_reexports_resolve_to_new_locations(self):
+        import core.sfm_models as compat
+
+        for name in compat.__all__:
+            self.assertIn(name, dir(compat))
+        self.assertIs(compat.Actor, Actor)
+        self.assertIs(compat.SFMGraph, SFMGraph)
+        self.assertIs(compat.NetworkMetrics, NetworkMetrics)
+
+    def test_unknown_attribute_raises(self):
+        import core.sfm_models as compat
+
+        with self.assertRaises(AttributeError):
+            getattr(compat, "NotAModel")
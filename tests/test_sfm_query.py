@@ -178,6 +178,7 @@ class TestNetworkXSFMQueryEngineUnit(unittest.TestCase):
         # Check edge data - just verify structure exists
         self.assertGreater(len(nx_graph.edges()), 0)
 
+    @patch("utils.patterns.strategy.IGRAPH_AVAILABLE", False)
     @patch("networkx.betweenness_centrality")
     def test_get_node_centrality_betweenness(self, mock_centrality):
         """Test betweenness centrality calculation using centralized mocks."""
@@ -197,38 +198,31 @@ class TestNetworkXSFMQueryEngineUnit(unittest.TestCase):
 
     @patch("networkx.closeness_centrality")
     def test_get_node_centrality_closeness(self, mock_centrality):
-        """Test closeness centrality calculation using centralized mocks."""
-        centrality_data = {
-            self.actor1.id: 0.7,
-            self.actor2.id: 0.4
-        }
-        mock_centrality.return_value = centrality_data
+        """Test closeness centrality calculation only scores the requested node."""
+        mock_centrality.return_value = 0.7
 
         centrality = self.query_engine.get_node_centrality(self.actor1.id, "closeness")
 
         self.assertEqual(centrality, 0.7)
-        mock_centrality.assert_called_once()
+        mock_centrality.assert_called_once_with(
+            self.query_engine.nx_graph, u=self.actor1.id
+        )
 
-    @patch("networkx.degree_centrality")
-    def test_get_node_centrality_degree(self, mock_centrality):
-        """Test degree centrality calculation using centralized mocks."""
-        centrality_data = {
-            self.actor1.id: 0.6,
-            self.actor2.id: 0.8
-        }
-        mock_centrality.return_value = centrality_data
+    def test_get_node_centrality_degree(self):
+        """Test single-node degree centrality matches NetworkX."""
+        expected = nx.degree_centrality(self.query_engine.nx_graph)
 
         centrality = self.query_engine.get_node_centrality(self.actor1.id, "degree")
 
-        self.assertEqual(centrality, 0.6)
-        mock_centrality.assert_called_once()
+        self.assertAlmostEqual(centrality, expected[self.actor1.id])
 
     def test_get_node_centrality_invalid_type(self):
         """Test error handling for invalid centrality type."""
         with self.assertRaises(ValueError):
             self.query_engine.get_node_centrality(self.actor1.id, "invalid_type")
 
-    @patch("networkx.eigenvector_centrality")
+    @patch("utils.patterns.strategy.SCIPY_AVAILABLE", False)
+    @patch("utils.patterns.strategy._power_iterate")
     @patch("networkx.degree_centrality")
     def test_get_node_centrality_eigenvector_fallback(self, mock_degree, mock_eigenvector):
         """Test eigenvector centrality with fallback to degree centrality."""
@@ -248,7 +242,8 @@ class TestNetworkXSFMQueryEngineUnit(unittest.TestCase):
         mock_eigenvector.assert_called_once()
         mock_degree.assert_called_once()
 
-    @patch("networkx.eigenvector_centrality")
+    @patch("utils.patterns.strategy.SCIPY_AVAILABLE", False)
+    @patch("utils.patterns.strategy._power_iterate")
     def test_get_node_centrality_eigenvector_success(self, mock_eigenvector):
         """Test successful eigenvector centrality calculation."""
         centrality_data = {
@@ -262,6 +257,7 @@ class TestNetworkXSFMQueryEngineUnit(unittest.TestCase):
         self.assertEqual(centrality, 0.8)
         mock_eigenvector.assert_called_once()
 
+    @patch("utils.patterns.strategy.IGRAPH_AVAILABLE", False)
     @patch("networkx.betweenness_centrality")
     def test_get_most_central_nodes(self, mock_centrality):
         """Test getting most central nodes using centralized mocks."""
@@ -287,7 +283,8 @@ class TestNetworkXSFMQueryEngineUnit(unittest.TestCase):
         for node_id, score in central_actors:
             self.assertIn(node_id, [self.actor1.id, self.actor2.id])
 
-    @patch("networkx.eigenvector_centrality")
+    @patch("utils.patterns.strategy.SCIPY_AVAILABLE", False)
+    @patch("utils.patterns.strategy._power_iterate")
     @patch("networkx.degree_centrality")
     def test_get_most_central_nodes_eigenvector_fallback(self, mock_degree, mock_eigenvector):
         """Test eigenvector centrality fallback in get_most_central_nodes."""
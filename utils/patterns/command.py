@@ -172,6 +172,8 @@ class RemoveNodeCommand(Command):
         # Restore relationships
         for rel in self.removed_relationships:
             self.graph.relationships[rel.id] = rel
+        if hasattr(self.graph, '_clear_relationship_cache'):
+            self.graph._clear_relationship_cache()  # type: ignore  # Protected access needed for command pattern
         
         self.undone = True
         return result is not None  # type: ignore  # May return None in some cases
@@ -147,7 +147,7 @@ class EventBus:
         
         # Check if handler is already registered for this event type
         if any(h.get_handler_id() == handler_id for h in self._handlers[event_type]):
-            logger.warning(f"Handler {handler_id} already registered for event type {event_type}")
+            logger.warning("Handler %s already registered for event type %s", handler_id, event_type)
             return handler_id
         
         # Add handler to the list
@@ -168,7 +168,7 @@ class EventBus:
         
         self._metrics["handlers_registered"] += 1
         
-        logger.debug(f"Registered handler {handler_id} for event type {event_type}")
+        logger.debug("Registered handler %s for event type %s", handler_id, event_type)
         return handler_id
     
     def subscribe_to_all(self, handler: EventHandler) -> str:
@@ -197,7 +197,7 @@ class EventBus:
             )
             
             self._metrics["handlers_registered"] += 1
-            logger.debug(f"Registered wildcard handler {handler_id}")
+            logger.debug("Registered wildcard handler %s", handler_id)
         
         return handler_id
     
@@ -220,7 +220,7 @@ class EventBus:
                     if handler_id in self._handler_metadata:
                         del self._handler_metadata[handler_id]
                     self._metrics["handlers_removed"] += 1
-                    logger.debug(f"Removed wildcard handler {handler_id}")
+                    logger.debug("Removed wildcard handler %s", handler_id)
                     return True
             return False
         
@@ -232,7 +232,7 @@ class EventBus:
                     if handler_id in self._handler_metadata:
                         del self._handler_metadata[handler_id]
                     self._metrics["handlers_removed"] += 1
-                    logger.debug(f"Removed handler {handler_id} from event type {event_type}")
+                    logger.debug("Removed handler %s from event type %s", handler_id, event_type)
                     return True
         
         return False
@@ -246,13 +246,13 @@ class EventBus:
         """
         # Apply filters
         if not self._apply_filters(event):
-            logger.debug(f"Event {event.event_id} filtered out")
+            logger.debug("Event %s filtered out", event.event_id)
             return
         
         # Apply middleware
         processed_event = self._apply_middleware(event)
         if processed_event is None:
-            logger.debug(f"Event {event.event_id} consumed by middleware")
+            logger.debug("Event %s consumed by middleware", event.event_id)
             return
         
         # Add to history
@@ -262,7 +262,7 @@ class EventBus:
         self._process_event_sync(processed_event)
         
         self._metrics["events_published"] += 1
-        logger.debug(f"Published event {event.event_type} with ID {event.event_id}")
+        logger.debug("Published event %s with ID %s", event.event_type, event.event_id)
     
     async def publish_async(self, event: Event) -> None:
         """
@@ -299,7 +299,7 @@ class EventBus:
                 self._metrics["events_published"] += 1
                 
             except Exception as e:
-                logger.error(f"Error processing event: {e}")
+                logger.error("Error processing event: %s", e)
                 self._metrics["events_failed"] += 1
     
     def stop_async_processing(self) -> None:
@@ -324,7 +324,7 @@ class EventBus:
                 self._update_handler_metadata(handler, None, start_time)
                 
             except Exception as e:
-                logger.error(f"Error in handler {handler.get_handler_id()}: {e}")
+                logger.error("Error in handler %s: %s", handler.get_handler_id(), e)
                 self._handle_error(e, event, handler)
                 self._update_handler_metadata(handler, e, start_time)
     
@@ -356,7 +356,7 @@ class EventBus:
             await handler.handle_async(event)
             self._update_handler_metadata(handler, None, start_time)
         except Exception as e:
-            logger.error(f"Error in async handler {handler.get_handler_id()}: {e}")
+            logger.error("Error in async handler %s: %s", handler.get_handler_id(), e)
             self._handle_error(e, event, handler)
             self._update_handler_metadata(handler, e, start_time)
     
@@ -369,7 +369,7 @@ class EventBus:
             await loop.run_in_executor(None, handler.handle, event)
             self._update_handler_metadata(handler, None, start_time)
         except Exception as e:
-            logger.error(f"Error in sync handler {handler.get_handler_id()}: {e}")
+            logger.error("Error in sync handler %s: %s", handler.get_handler_id(), e)
             self._handle_error(e, event, handler)
             self._update_handler_metadata(handler, e, start_time)
     
@@ -396,7 +396,7 @@ class EventBus:
                 if not filter_func(event):
                     return False
             except Exception as e:
-                logger.error(f"Error in event filter: {e}")
+                logger.error("Error in event filter: %s", e)
         return True
     
     def _apply_middleware(self, event: Event) -> Optional[Event]:
@@ -409,7 +409,7 @@ class EventBus:
                 if current_event is None:
                     return None
             except Exception as e:
-                logger.error(f"Error in middleware: {e}")
+                logger.error("Error in middleware: %s", e)
                 return None
         
         return current_event
@@ -422,7 +422,7 @@ class EventBus:
             try:
                 error_handler(error, event, handler)
             except Exception as e:
-                logger.error(f"Error in error handler: {e}")
+                logger.error("Error in error handler: %s", e)
     
     def _update_handler_metadata(self, handler: EventHandler, error: Optional[Exception], start_time: datetime) -> None:
         """Update handler metadata with execution information."""
@@ -508,7 +508,7 @@ class LoggingEventHandler(EventHandler):
     
     def handle(self, event: Event) -> None:
         """Log the event."""
-        logger.info(f"Event {event.event_type} at {event.timestamp}: {event.data}")
+        logger.info("Event %s at %s: %s", event.event_type, event.timestamp, event.data)
     
     def get_supported_event_types(self) -> List[str]:
         """This handler supports all event types."""
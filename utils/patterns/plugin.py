@@ -5,11 +5,15 @@ This module implements a plugin system that allows for easy extension of the
 SFM framework with custom entities, relationships, and analysis capabilities.
 """
 
+import os
+import sys
+import time
 import uuid
 import importlib
-import inspect
+import importlib.util
+import itertools
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Type, Any, Callable, Set
+from typing import Dict, List, Optional, Type, Any, Callable, Set, FrozenSet, Tuple, Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -28,6 +32,10 @@ class PluginStatus(Enum):
     ERROR = "error"
 
 
+# String form of each status, resolved once instead of per Enum .value access
+_STATUS_VALUES: Dict[PluginStatus, str] = {status: status.value for status in PluginStatus}
+
+
 @dataclass
 class PluginMetadata:
     """Metadata about a plugin."""
@@ -112,60 +120,121 @@ class SFMPlugin(ABC):
         return {}
 
 
+def _is_concrete_plugin_class(obj: Any, module_name: str) -> bool:
+    """Check whether obj is an instantiable SFMPlugin subclass defined in module_name."""
+    return (isinstance(obj, type)
+            and obj is not SFMPlugin
+            and issubclass(obj, SFMPlugin)
+            and not obj.__abstractmethods__
+            and obj.__module__ == module_name)
+
+
 class PluginRegistry:
     """Registry for managing entity types and relationships from plugins."""
     
+    # Resource kind -> (key in resource listings, label used in duplicate errors)
+    _RESOURCE_KINDS: Dict[str, Tuple[str, str]] = {
+        "entity": ("entity_types", "Entity type {}"),
+        "relationship": ("relationship_kinds", "Relationship kind {}"),
+        "analyzer": ("analyzers", "Analyzer {}"),
+        "validator": ("validators", "Validator {}"),
+        "event": ("event_handlers", "Event handler for {}"),
+    }
+    
     def __init__(self):
         self._entity_types: Dict[str, Type[Node]] = {}
         self._relationship_kinds: Dict[str, RelationshipKind] = {}
         self._analyzers: Dict[str, Callable] = {}
         self._validators: Dict[str, Callable] = {}
         self._event_handlers: Dict[str, Callable] = {}
-        self._plugin_owners: Dict[str, str] = {}  # Maps resource name to plugin name
+        self._plugin_owners: Dict[Tuple[str, str], str] = {}  # Maps (kind, name) to plugin name
+        self._stores: Dict[str, Dict[str, Any]] = {
+            "entity": self._entity_types,
+            "relationship": self._relationship_kinds,
+            "analyzer": self._analyzers,
+            "validator": self._validators,
+            "event": self._event_handlers,
+        }
+    
+    def _register(self, kind: str, key: str, value: Any, plugin_name: str) -> None:
+        """Store a resource of the given kind and record its owning plugin."""
+        store = self._stores[kind]
+        if key in store:
+            label = self._RESOURCE_KINDS[kind][1].format(key)
+            raise ValueError(f"{label} already registered")
+        
+        store[key] = value
+        # Interned owner names make the owner scans compare by identity first
+        self._plugin_owners[(kind, key)] = sys.intern(plugin_name)
     
     def register_entity_type(self, entity_type: Type[Node], plugin_name: str) -> None:
         """Register a custom entity type."""
-        type_name = entity_type.__name__
-        
-        if type_name in self._entity_types:
-            raise ValueError(f"Entity type {type_name} already registered")
-        
-        self._entity_types[type_name] = entity_type
-        self._plugin_owners[f"entity:{type_name}"] = plugin_name
+        self._register("entity", entity_type.__name__, entity_type, plugin_name)
     
     def register_relationship_kind(self, relationship_kind: RelationshipKind, plugin_name: str) -> None:
         """Register a custom relationship kind."""
-        kind_name = relationship_kind.name
-        
-        if kind_name in self._relationship_kinds:
-            raise ValueError(f"Relationship kind {kind_name} already registered")
-        
-        self._relationship_kinds[kind_name] = relationship_kind
-        self._plugin_owners[f"relationship:{kind_name}"] = plugin_name
+        self._register("relationship", relationship_kind.name, relationship_kind, plugin_name)
     
     def register_analyzer(self, name: str, analyzer: Callable, plugin_name: str) -> None:
         """Register a custom analyzer function."""
-        if name in self._analyzers:
-            raise ValueError(f"Analyzer {name} already registered")
-        
-        self._analyzers[name] = analyzer
-        self._plugin_owners[f"analyzer:{name}"] = plugin_name
+        self._register("analyzer", name, analyzer, plugin_name)
     
     def register_validator(self, name: str, validator: Callable, plugin_name: str) -> None:
         """Register a custom validator function."""
-        if name in self._validators:
-            raise ValueError(f"Validator {name} already registered")
-        
-        self._validators[name] = validator
-        self._plugin_owners[f"validator:{name}"] = plugin_name
+        self._register("validator", name, validator, plugin_name)
     
     def register_event_handler(self, event_type: str, handler: Callable, plugin_name: str) -> None:
         """Register a custom event handler."""
-        if event_type in self._event_handlers:
-            raise ValueError(f"Event handler for {event_type} already registered")
+        self._register("event", event_type, handler, plugin_name)
+    
+    def register_from_plugin(
+        self,
+        plugin_name: str,
+        entities: Iterable[Type[Node]] = (),
+        relationships: Iterable[RelationshipKind] = (),
+        analyzers: Optional[Dict[str, Callable]] = None,
+        validators: Optional[Dict[str, Callable]] = None,
+        event_handlers: Optional[Dict[str, Callable]] = None
+    ) -> None:
+        """
+        Register all resources provided by a plugin in one batch.
+        
+        Every resource is checked for conflicts before anything is stored, so
+        either the whole batch is registered or none of it is.
+        
+        Raises:
+            ValueError: If any resource is already registered or duplicated
+                within the batch
+        """
+        entity_list = list(entities)
+        relationship_list = list(relationships)
+        batch: Dict[str, Dict[str, Any]] = {
+            "entity": {entity_type.__name__: entity_type for entity_type in entity_list},
+            "relationship": {kind.name: kind for kind in relationship_list},
+            "analyzer": dict(analyzers or {}),
+            "validator": dict(validators or {}),
+            "event": dict(event_handlers or {}),
+        }
+        
+        if (len(batch["entity"]) != len(entity_list)
+                or len(batch["relationship"]) != len(relationship_list)):
+            raise ValueError(
+                f"Plugin {plugin_name} provides duplicate entity types or relationship kinds"
+            )
         
-        self._event_handlers[event_type] = handler
-        self._plugin_owners[f"event:{event_type}"] = plugin_name
+        for kind, resources in batch.items():
+            store = self._stores[kind]
+            if not store.keys().isdisjoint(resources):
+                duplicate = next(key for key in resources if key in store)
+                label = self._RESOURCE_KINDS[kind][1].format(duplicate)
+                raise ValueError(f"{label} already registered")
+        
+        plugin_name = sys.intern(plugin_name)
+        for kind, resources in batch.items():
+            self._stores[kind].update(resources)
+            self._plugin_owners.update(
+                dict.fromkeys(((kind, key) for key in resources), plugin_name)
+            )
     
     def get_entity_type(self, type_name: str) -> Optional[Type[Node]]:
         """Get an entity type by name."""
@@ -189,6 +258,7 @@ class PluginRegistry:
     
     def unregister_plugin_resources(self, plugin_name: str) -> None:
         """Unregister all resources from a specific plugin."""
+        plugin_name = sys.intern(plugin_name)
         # Find all resources owned by this plugin
         resources_to_remove = [
             resource for resource, owner in self._plugin_owners.items()
@@ -196,54 +266,26 @@ class PluginRegistry:
         ]
         
         for resource in resources_to_remove:
-            resource_type, resource_name = resource.split(":", 1)
-            
-            if resource_type == "entity":
-                self._entity_types.pop(resource_name, None)
-            elif resource_type == "relationship":
-                self._relationship_kinds.pop(resource_name, None)
-            elif resource_type == "analyzer":
-                self._analyzers.pop(resource_name, None)
-            elif resource_type == "validator":
-                self._validators.pop(resource_name, None)
-            elif resource_type == "event":
-                self._event_handlers.pop(resource_name, None)
-            
+            resource_type, resource_name = resource
+            self._stores[resource_type].pop(resource_name, None)
             del self._plugin_owners[resource]
     
     def get_registered_resources(self) -> Dict[str, List[str]]:
         """Get all registered resources by type."""
         return {
-            "entity_types": list(self._entity_types.keys()),
-            "relationship_kinds": list(self._relationship_kinds.keys()),
-            "analyzers": list(self._analyzers.keys()),
-            "validators": list(self._validators.keys()),
-            "event_handlers": list(self._event_handlers.keys())
+            listing_key: list(self._stores[kind].keys())
+            for kind, (listing_key, _) in self._RESOURCE_KINDS.items()
         }
     
     def get_plugin_resources(self, plugin_name: str) -> Dict[str, List[str]]:
         """Get all resources registered by a specific plugin."""
-        plugin_resources = {
-            "entity_types": [],
-            "relationship_kinds": [],
-            "analyzers": [],
-            "validators": [],
-            "event_handlers": []
+        plugin_resources: Dict[str, List[str]] = {
+            listing_key: [] for listing_key, _ in self._RESOURCE_KINDS.values()
         }
         
-        for resource, owner in self._plugin_owners.items():
+        for (resource_type, resource_name), owner in self._plugin_owners.items():
             if owner == plugin_name:
-                resource_type, resource_name = resource.split(":", 1)
-                if resource_type == "entity":
-                    plugin_resources["entity_types"].append(resource_name)
-                elif resource_type == "relationship":
-                    plugin_resources["relationship_kinds"].append(resource_name)
-                elif resource_type == "analyzer":
-                    plugin_resources["analyzers"].append(resource_name)
-                elif resource_type == "validator":
-                    plugin_resources["validators"].append(resource_name)
-                elif resource_type == "event":
-                    plugin_resources["event_handlers"].append(resource_name)
+                plugin_resources[self._RESOURCE_KINDS[resource_type][0]].append(resource_name)
         
         return plugin_resources
 
@@ -261,8 +303,18 @@ class PluginManager:
         self._plugin_registry = PluginRegistry()
         self._plugin_directories: List[Path] = []
         self._framework_context: Dict[str, Any] = {}
-        self._dependency_graph: Dict[str, Set[str]] = {}
+        self._dependency_graph: Dict[str, FrozenSet[str]] = {}
         self._initialization_order: List[str] = []
+        # Reverse index of plugin names by status, kept in sync by _set_status;
+        # dicts with None values act as insertion-ordered sets
+        self._plugins_by_status: Dict[PluginStatus, Dict[str, None]] = {
+            status: {} for status in PluginStatus
+        }
+        # Maps plugin name to its position in self._plugins, so status
+        # listings can be returned in load order
+        self._load_sequence: Dict[str, int] = {}
+        self._load_counter = itertools.count()
+        self._failed_imports: Dict[str, str] = {}  # Maps plugin name to import error
     
     def add_plugin_directory(self, directory: Path) -> None:
         """Add a directory to search for plugins."""
@@ -278,9 +330,15 @@ class PluginManager:
         discovered_plugins = []
         
         for directory in self._plugin_directories:
-            for plugin_file in directory.glob("*.py"):
-                if plugin_file.stem.startswith("plugin_"):
-                    discovered_plugins.append(plugin_file.stem)
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if (name.startswith("plugin_") and name.endswith(".py")
+                                and entry.is_file()):
+                            discovered_plugins.append(name[:-3])
+            except OSError:
+                continue  # Directory removed or unreadable since registration
         
         return discovered_plugins
     
@@ -298,23 +356,28 @@ class PluginManager:
         if plugin_name in self._plugins:
             return False  # Already loaded
         
+        plugin_name = sys.intern(plugin_name)
+        
         start_time = datetime.now()
+        start_perf = time.perf_counter_ns()
         
         try:
-            # Import the plugin module
-            if plugin_path:
-                spec = importlib.util.spec_from_file_location(plugin_name, plugin_path)
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-            else:
-                module = importlib.import_module(plugin_name)
+            # Import the plugin module; failed imports are remembered so that
+            # retries skip the import machinery until clear_failed_imports()
+            cached_error = self._failed_imports.get(plugin_name)
+            if cached_error is not None:
+                raise ImportError(cached_error)
+            
+            try:
+                module = self._import_plugin_module(plugin_name, plugin_path)
+            except Exception as e:
+                self._failed_imports[plugin_name] = str(e)
+                raise
             
             # Find the plugin class
             plugin_class = None
-            for name, obj in inspect.getmembers(module):
-                if (inspect.isclass(obj) and 
-                    issubclass(obj, SFMPlugin) and 
-                    obj is not SFMPlugin):
+            for obj in vars(module).values():
+                if _is_concrete_plugin_class(obj, module.__name__):
                     plugin_class = obj
                     break
             
@@ -333,7 +396,7 @@ class PluginManager:
             plugin_instance.initialize(self._framework_context)
             
             # Create plugin info
-            load_time = (datetime.now() - start_time).total_seconds() * 1000
+            load_time = (time.perf_counter_ns() - start_perf) / 1_000_000
             plugin_info = PluginInfo(
                 metadata=metadata,
                 plugin_instance=plugin_instance,
@@ -343,9 +406,11 @@ class PluginManager:
             )
             
             self._plugins[plugin_name] = plugin_info
+            self._load_sequence[plugin_name] = next(self._load_counter)
+            self._plugins_by_status[PluginStatus.LOADED][plugin_name] = None
             
             # Update dependency graph
-            self._dependency_graph[plugin_name] = set(metadata.dependencies)
+            self._dependency_graph[plugin_name] = frozenset(metadata.dependencies)
             
             return True
             
@@ -365,8 +430,34 @@ class PluginManager:
             )
             
             self._plugins[plugin_name] = error_plugin_info
+            self._load_sequence[plugin_name] = next(self._load_counter)
+            self._plugins_by_status[PluginStatus.ERROR][plugin_name] = None
             return False
     
+    def _import_plugin_module(self, plugin_name: str, plugin_path: Optional[Path]) -> Any:
+        """Import a plugin module from a file path or the import path."""
+        if not plugin_path:
+            return importlib.import_module(plugin_name)
+        
+        spec = importlib.util.spec_from_file_location(plugin_name, plugin_path)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Cannot import plugin {plugin_name} from {plugin_path}")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+    
+    def clear_failed_imports(self, plugin_name: Optional[str] = None) -> None:
+        """
+        Forget cached import failures so the plugins can be imported again.
+        
+        Args:
+            plugin_name: Plugin to forget; clears every cached failure if None
+        """
+        if plugin_name is None:
+            self._failed_imports.clear()
+        else:
+            self._failed_imports.pop(plugin_name, None)
+    
     def activate_plugin(self, plugin_name: str) -> bool:
         """
         Activate a loaded plugin.
@@ -388,30 +479,24 @@ class PluginManager:
         try:
             plugin = plugin_info.plugin_instance
             
-            # Register plugin resources
-            for entity_type in plugin.register_entities():
-                self._plugin_registry.register_entity_type(entity_type, plugin_name)
-            
-            for relationship_kind in plugin.register_relationships():
-                self._plugin_registry.register_relationship_kind(relationship_kind, plugin_name)
-            
-            for name, analyzer in plugin.register_analyzers().items():
-                self._plugin_registry.register_analyzer(name, analyzer, plugin_name)
-            
-            for name, validator in plugin.register_validators().items():
-                self._plugin_registry.register_validator(name, validator, plugin_name)
-            
-            for event_type, handler in plugin.register_event_handlers().items():
-                self._plugin_registry.register_event_handler(event_type, handler, plugin_name)
+            # Register plugin resources as a single all-or-nothing batch
+            self._plugin_registry.register_from_plugin(
+                plugin_name,
+                entities=plugin.register_entities(),
+                relationships=plugin.register_relationships(),
+                analyzers=plugin.register_analyzers(),
+                validators=plugin.register_validators(),
+                event_handlers=plugin.register_event_handlers()
+            )
             
             # Update plugin status
-            plugin_info.status = PluginStatus.ACTIVATED
+            self._set_status(plugin_name, plugin_info, PluginStatus.ACTIVATED)
             plugin_info.activated_at = datetime.now()
             
             return True
             
         except Exception as e:
-            plugin_info.status = PluginStatus.ERROR
+            self._set_status(plugin_name, plugin_info, PluginStatus.ERROR)
             plugin_info.error_message = str(e)
             return False
     
@@ -442,13 +527,13 @@ class PluginManager:
                 plugin_info.plugin_instance.cleanup()
             
             # Update plugin status
-            plugin_info.status = PluginStatus.DEACTIVATED
+            self._set_status(plugin_name, plugin_info, PluginStatus.DEACTIVATED)
             plugin_info.deactivated_at = datetime.now()
             
             return True
             
         except Exception as e:
-            plugin_info.status = PluginStatus.ERROR
+            self._set_status(plugin_name, plugin_info, PluginStatus.ERROR)
             plugin_info.error_message = str(e)
             return False
     
@@ -480,6 +565,8 @@ class PluginManager:
         
         # Remove from registry
         del self._plugins[plugin_name]
+        del self._load_sequence[plugin_name]
+        self._plugins_by_status[plugin_info.status].pop(plugin_name, None)
         
         # Remove from dependency graph
         if plugin_name in self._dependency_graph:
@@ -492,13 +579,12 @@ class PluginManager:
         return self._plugins.get(plugin_name)
     
     def list_plugins(self, status: Optional[PluginStatus] = None) -> List[PluginInfo]:
-        """List all plugins, optionally filtered by status."""
-        plugins = list(self._plugins.values())
-        
+        """List all plugins in load order, optionally filtered by status."""
         if status is not None:
-            plugins = [p for p in plugins if p.status == status]
+            names = sorted(self._plugins_by_status[status], key=self._load_sequence.__getitem__)
+            return [self._plugins[name] for name in names]
         
-        return plugins
+        return list(self._plugins.values())
     
     def get_plugin_registry(self) -> PluginRegistry:
         """Get the plugin registry."""
@@ -518,7 +604,7 @@ class PluginManager:
             plugin_info.plugin_instance.configure(config)
             return True
         except Exception as e:
-            plugin_info.status = PluginStatus.ERROR
+            self._set_status(plugin_name, plugin_info, PluginStatus.ERROR)
             plugin_info.error_message = str(e)
             return False
     
@@ -554,15 +640,15 @@ class PluginManager:
     
     def _check_dependencies(self, dependencies: List[str]) -> bool:
         """Check if all dependencies are satisfied."""
-        for dep in dependencies:
-            if dep not in self._plugins:
-                return False
-            
-            plugin_info = self._plugins[dep]
-            if plugin_info.status != PluginStatus.ACTIVATED:
-                return False
-        
-        return True
+        activated = self._plugins_by_status[PluginStatus.ACTIVATED]
+        return all(dep in activated for dep in dependencies)
+    
+    def _set_status(self, plugin_name: str, plugin_info: PluginInfo,
+                    new_status: PluginStatus) -> None:
+        """Transition a plugin to a new status, keeping the status index in sync."""
+        self._plugins_by_status[plugin_info.status].pop(plugin_name, None)
+        self._plugins_by_status[new_status][plugin_name] = None
+        plugin_info.status = new_status
     
     def _calculate_initialization_order(self) -> List[str]:
         """Calculate plugin initialization order based on dependencies."""
@@ -581,7 +667,7 @@ class PluginManager:
             temp_visited.add(plugin_name)
             
             # Visit dependencies first
-            for dep in self._dependency_graph.get(plugin_name, []):
+            for dep in self._dependency_graph.get(plugin_name, ()):
                 visit(dep)
             
             temp_visited.remove(plugin_name)
@@ -619,9 +705,10 @@ class PluginManager:
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get plugin manager statistics."""
-        status_counts = {}
-        for status in PluginStatus:
-            status_counts[status.value] = len([p for p in self._plugins.values() if p.status == status])
+        status_counts = {
+            _STATUS_VALUES[status]: len(names)
+            for status, names in self._plugins_by_status.items()
+        }
         
         return {
             "total_plugins": len(self._plugins),
@@ -631,10 +718,13 @@ class PluginManager:
         }
 
 
-# Global plugin manager instance
-_global_plugin_manager = PluginManager()
+# Global plugin manager instance, created on first use
+_global_plugin_manager: Optional[PluginManager] = None
 
 
 def get_global_plugin_manager() -> PluginManager:
     """Get the global plugin manager instance."""
+    global _global_plugin_manager
+    if _global_plugin_manager is None:
+        _global_plugin_manager = PluginManager()
     return _global_plugin_manager
\ No newline at end of file
@@ -6,15 +6,44 @@ for various graph analysis operations, allowing for easy extensibility and
 algorithm swapping without modifying core code.
 """
 
+import math
 import uuid
+import logging
+from concurrent.futures import ProcessPoolExecutor
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional, Type, Callable
+from typing import Dict, List, Any, Optional, Type, Callable, Tuple, Iterator, NamedTuple
 from dataclasses import dataclass
 
 import networkx as nx
 
 from models.base_nodes import Node
 
+logger = logging.getLogger(__name__)
+
+# Optional igraph backend for C-implemented community detection
+try:
+    import igraph as ig
+    IGRAPH_AVAILABLE = True
+except ImportError:
+    ig = None
+    IGRAPH_AVAILABLE = False
+
+# Optional numpy, used to group igraph community memberships
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Optional SciPy backend for ARPACK-based eigenvector centrality
+try:
+    from scipy.sparse.linalg import ArpackNoConvergence
+    SCIPY_AVAILABLE = True
+except ImportError:
+    ArpackNoConvergence = None
+    SCIPY_AVAILABLE = False
+
 
 class Strategy(ABC):
     """Abstract base class for all strategies."""
@@ -35,6 +64,76 @@ class Strategy(ABC):
         pass
 
 
+class _GraphFingerprint(NamedTuple):
+    """Structural properties strategies branch on."""
+    directed: bool
+    multigraph: bool
+    weighted: bool
+    node_count: int
+
+
+def _graph_fingerprint(graph: nx.Graph) -> _GraphFingerprint:
+    """Return the fingerprint of graph, scanning its edges once for weights."""
+    return _GraphFingerprint(
+        directed=graph.is_directed(),
+        multigraph=graph.is_multigraph(),
+        weighted=any("weight" in data for _, _, data in graph.edges(data=True)),
+        node_count=graph.number_of_nodes(),
+    )
+
+
+def _to_igraph(graph: nx.Graph, directed: bool = False,
+               weighted: bool = True) -> Tuple[Any, List[uuid.UUID]]:
+    """
+    Convert a NetworkX graph to a simple igraph graph.
+    
+    Parallel edges are merged into a single edge. When weighted, the merged
+    edge's "weight" is the sum of their weights (default 1), matching how
+    NetworkX's Louvain treats multigraphs. Reciprocal edges of a directed
+    graph converted to an undirected one are not summed: like
+    ``DiGraph.to_undirected``, one of them supplies the weight. Graphs with
+    no weights and nothing to merge are converted without a "weight"
+    attribute so igraph runs unweighted.
+    
+    Args:
+        graph: Graph to convert
+        directed: Keep edge direction; only honoured for directed graphs
+        weighted: Carry edge weights over as the "weight" attribute
+        
+    Returns:
+        The igraph graph and the node ids indexed by igraph vertex id
+    """
+    fingerprint = _graph_fingerprint(graph)
+    directed = directed and fingerprint.directed
+    weighted = weighted and (fingerprint.weighted or fingerprint.multigraph)
+    nodes = list(graph.nodes())
+    index = {node: i for i, node in enumerate(nodes)}
+    
+    if not weighted:
+        edges = [(index[source], index[target]) for source, target in graph.edges()]
+        ig_graph = ig.Graph(n=len(nodes), edges=edges, directed=directed)
+        if fingerprint.multigraph or fingerprint.directed != directed:
+            ig_graph.simplify(multiple=True, loops=False)
+        return ig_graph, nodes
+    
+    # Parallel edges share a key and their weights are summed
+    edge_weights: Dict[Tuple[int, int], Any] = {}
+    for source, target, weight in graph.edges(data="weight", default=1):
+        edge = (index[source], index[target])
+        edge_weights[edge] = edge_weights[edge] + weight if edge in edge_weights else weight
+    
+    if fingerprint.directed and not directed:
+        # The later of two reciprocal edges wins, as in DiGraph.to_undirected
+        edge_weights = {
+            (source, target) if source <= target else (target, source): weight
+            for (source, target), weight in edge_weights.items()
+        }
+    
+    ig_graph = ig.Graph(n=len(nodes), edges=list(edge_weights), directed=directed)
+    ig_graph.es["weight"] = list(edge_weights.values())
+    return ig_graph, nodes
+
+
 class CentralityStrategy(Strategy):
     """Abstract base class for centrality calculation strategies."""
     
@@ -47,10 +146,31 @@ class CentralityStrategy(Strategy):
     def calculate_all(self, graph: nx.Graph) -> Dict[uuid.UUID, float]:
         """Calculate centrality for all nodes in the graph."""
         pass
+    
+    def execute(self, graph: nx.Graph, node_id: Optional[uuid.UUID] = None, **kwargs) -> Any:
+        """Score node_id if given, otherwise every node in the graph."""
+        if node_id is not None:
+            return self.calculate(graph, node_id)
+        return self.calculate_all(graph)
+
+
+def _betweenness_from_sources(graph: nx.Graph, sources: List[uuid.UUID]) -> Dict[uuid.UUID, float]:
+    """Unnormalized betweenness contributed by shortest paths starting at sources."""
+    return nx.betweenness_centrality_subset(graph, sources, list(graph.nodes()), normalized=False)
 
 
 class BetweennessCentralityStrategy(CentralityStrategy):
-    """Strategy for calculating betweenness centrality."""
+    """
+    Strategy for calculating betweenness centrality.
+    
+    Without igraph, graphs with at least ``parallel_threshold`` nodes can be
+    processed by ``max_workers`` processes, each accumulating the path
+    dependencies of a slice of the source vertices.
+    """
+    
+    def __init__(self, max_workers: Optional[int] = None, parallel_threshold: int = 500):
+        self.max_workers = max_workers
+        self.parallel_threshold = parallel_threshold
     
     def get_name(self) -> str:
         return "betweenness"
@@ -63,18 +183,46 @@ class BetweennessCentralityStrategy(CentralityStrategy):
         if node_id not in graph.nodes():
             return 0.0
         
-        centrality_scores = nx.betweenness_centrality(graph)
+        centrality_scores = self._compute_scores(graph)
         return centrality_scores.get(node_id, 0.0)
     
     def calculate_all(self, graph: nx.Graph) -> Dict[uuid.UUID, float]:
         """Calculate betweenness centrality for all nodes."""
-        return nx.betweenness_centrality(graph)
+        return self._compute_scores(graph)
     
-    def execute(self, graph: nx.Graph, node_id: Optional[uuid.UUID] = None, **kwargs) -> Any:
-        """Execute the strategy."""
-        if node_id is not None:
-            return self.calculate(graph, node_id)
-        return self.calculate_all(graph)
+    def _compute_scores(self, graph: nx.Graph) -> Dict[uuid.UUID, float]:
+        """Compute normalized betweenness, using igraph's C implementation when available."""
+        node_count = graph.number_of_nodes()
+        if node_count <= 2:
+            return nx.betweenness_centrality(graph)
+        
+        directed = graph.is_directed()
+        if IGRAPH_AVAILABLE:
+            ig_graph, nodes = _to_igraph(graph, directed=directed, weighted=False)
+            raw_scores = dict(zip(nodes, ig_graph.betweenness(directed=directed)))
+        elif self.max_workers and self.max_workers > 1 and node_count >= self.parallel_threshold:
+            raw_scores = self._compute_parallel(graph)
+        else:
+            return nx.betweenness_centrality(graph)
+        
+        # Undirected raw scores count each pair once where the normalized
+        # NetworkX score counts it in both directions
+        scale = (1.0 if directed else 2.0) / ((node_count - 1) * (node_count - 2))
+        return {node: score * scale for node, score in raw_scores.items()}
+    
+    def _compute_parallel(self, graph: nx.Graph) -> Dict[uuid.UUID, float]:
+        """Sum unnormalized betweenness over source-vertex slices in worker processes."""
+        nodes = list(graph.nodes())
+        chunks = [nodes[i::self.max_workers] for i in range(self.max_workers)]
+        raw_scores = dict.fromkeys(nodes, 0.0)
+        
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            partials = executor.map(_betweenness_from_sources, [graph] * len(chunks), chunks)
+            for partial in partials:
+                for node, score in partial.items():
+                    raw_scores[node] += score
+        
+        return raw_scores
 
 
 class ClosenessCentralityStrategy(CentralityStrategy):
@@ -91,18 +239,51 @@ class ClosenessCentralityStrategy(CentralityStrategy):
         if node_id not in graph.nodes():
             return 0.0
         
-        centrality_scores = nx.closeness_centrality(graph)
-        return centrality_scores.get(node_id, 0.0)
+        # A single node only needs one shortest-path search from that node
+        return nx.closeness_centrality(graph, u=node_id)
     
     def calculate_all(self, graph: nx.Graph) -> Dict[uuid.UUID, float]:
         """Calculate closeness centrality for all nodes."""
         return nx.closeness_centrality(graph)
+
+
+def _power_iterate(graph: nx.Graph, max_iter: int = 1000, tol: float = 1.0e-6) -> Dict[uuid.UUID, float]:
+    """
+    Unweighted eigenvector centrality by power iteration on (A + I).
     
-    def execute(self, graph: nx.Graph, node_id: Optional[uuid.UUID] = None, **kwargs) -> Any:
-        """Execute the strategy."""
-        if node_id is not None:
-            return self.calculate(graph, node_id)
-        return self.calculate_all(graph)
+    Equivalent to ``nx.eigenvector_centrality(graph, max_iter=max_iter)``, but
+    nodes are renumbered to list positions and each node's successors are
+    materialised once as a tuple of indices, so the iteration hashes ints
+    rather than UUIDs. Node ids are restored only in the returned dict.
+    
+    Raises:
+        NetworkXPointlessConcept: If the graph is empty
+        PowerIterationFailedConvergence: If max_iter iterations do not converge
+    """
+    if len(graph) == 0:
+        raise nx.NetworkXPointlessConcept("cannot compute centrality for the null graph")
+    
+    nodes = list(graph)
+    index = {node: i for i, node in enumerate(nodes)}
+    successors = [tuple(index[neighbor] for neighbor in graph[node]) for node in nodes]
+    node_count = len(nodes)
+    threshold = node_count * tol
+    x = [1.0 / node_count] * node_count
+    
+    for _ in range(max_iter):
+        x_last = x
+        x = x_last.copy()
+        for i, neighbors in enumerate(successors):
+            value = x_last[i]
+            for j in neighbors:
+                x[j] += value
+        
+        norm = math.hypot(*x) or 1
+        x = [value / norm for value in x]
+        if sum(abs(new - old) for new, old in zip(x, x_last)) < threshold:
+            return dict(zip(nodes, x))
+    
+    raise nx.PowerIterationFailedConvergence(max_iter)
 
 
 class EigenvectorCentralityStrategy(CentralityStrategy):
@@ -119,27 +300,38 @@ class EigenvectorCentralityStrategy(CentralityStrategy):
         if node_id not in graph.nodes():
             return 0.0
         
-        try:
-            centrality_scores = nx.eigenvector_centrality(graph, max_iter=1000)
-            return centrality_scores.get(node_id, 0.0)
-        except nx.NetworkXError:
-            # Fallback to degree centrality if eigenvector fails to converge
-            centrality_scores = nx.degree_centrality(graph)
-            return centrality_scores.get(node_id, 0.0)
+        centrality_scores = self._compute_scores(graph)
+        return centrality_scores.get(node_id, 0.0)
     
     def calculate_all(self, graph: nx.Graph) -> Dict[uuid.UUID, float]:
         """Calculate eigenvector centrality for all nodes."""
+        return self._compute_scores(graph)
+    
+    @staticmethod
+    def _compute_scores(graph: nx.Graph) -> Dict[uuid.UUID, float]:
+        """Compute eigenvector centrality, falling back to degree centrality."""
+        fingerprint = _graph_fingerprint(graph)
+        # ARPACK needs at least three nodes to extract a single eigenvector
+        if SCIPY_AVAILABLE and fingerprint.node_count > 2:
+            # Parallel edges count once, matching the power iteration below
+            simple_graph = (
+                (nx.DiGraph(graph) if fingerprint.directed else nx.Graph(graph))
+                if fingerprint.multigraph else graph
+            )
+            try:
+                # Unweighted, like the power iteration, so results do not
+                # depend on whether SciPy is installed
+                return nx.eigenvector_centrality_numpy(simple_graph, weight=None)
+            except nx.AmbiguousSolution:
+                pass  # Disconnected graph: the power iteration is well defined
+            except ArpackNoConvergence:
+                return nx.degree_centrality(graph)
+        
         try:
-            return nx.eigenvector_centrality(graph, max_iter=1000)
-        except nx.NetworkXError:
+            return _power_iterate(graph)
+        except (nx.NetworkXError, nx.PowerIterationFailedConvergence):
             # Fallback to degree centrality if eigenvector fails to converge
             return nx.degree_centrality(graph)
-    
-    def execute(self, graph: nx.Graph, node_id: Optional[uuid.UUID] = None, **kwargs) -> Any:
-        """Execute the strategy."""
-        if node_id is not None:
-            return self.calculate(graph, node_id)
-        return self.calculate_all(graph)
 
 
 class DegreeCentralityStrategy(CentralityStrategy):
@@ -156,18 +348,15 @@ class DegreeCentralityStrategy(CentralityStrategy):
         if node_id not in graph.nodes():
             return 0.0
         
-        centrality_scores = nx.degree_centrality(graph)
-        return centrality_scores.get(node_id, 0.0)
+        # Same definition as nx.degree_centrality, without scoring every node
+        node_count = graph.number_of_nodes()
+        if node_count <= 1:
+            return 1.0
+        return graph.degree(node_id) / (node_count - 1)
     
     def calculate_all(self, graph: nx.Graph) -> Dict[uuid.UUID, float]:
         """Calculate degree centrality for all nodes."""
         return nx.degree_centrality(graph)
-    
-    def execute(self, graph: nx.Graph, node_id: Optional[uuid.UUID] = None, **kwargs) -> Any:
-        """Execute the strategy."""
-        if node_id is not None:
-            return self.calculate(graph, node_id)
-        return self.calculate_all(graph)
 
 
 class CommunityDetectionStrategy(Strategy):
@@ -177,6 +366,54 @@ class CommunityDetectionStrategy(Strategy):
     def detect_communities(self, graph: nx.Graph) -> Dict[int, List[uuid.UUID]]:
         """Detect communities in the graph."""
         pass
+    
+    def execute(self, graph: nx.Graph, **kwargs) -> Dict[int, List[uuid.UUID]]:
+        """Execute the strategy."""
+        return self.detect_communities(graph)
+    
+    @staticmethod
+    def _detect_with_igraph(graph: nx.Graph, algorithm: Callable[[Any, Optional[str]], Any],
+                            weighted: bool = False) -> Optional[Dict[int, List[uuid.UUID]]]:
+        """
+        Run an igraph community algorithm and map vertex ids back to node ids.
+        
+        The algorithm is called with the igraph graph and the edge weight
+        attribute, which is None for graphs converted without weights.
+        
+        Returns:
+            The communities, or None if igraph rejected the graph (e.g.
+            negative or non-numeric weights) and the caller should fall back
+            to its NetworkX implementation
+        """
+        try:
+            ig_graph, nodes = _to_igraph(graph, weighted=weighted)
+            weights = "weight" if ig_graph.is_weighted() else None
+            membership = algorithm(ig_graph, weights).membership
+        except Exception as e:  # pylint: disable=broad-except
+            logger.warning("igraph community detection failed, falling back to NetworkX: %s", e)
+            return None
+        if not membership:
+            return {}
+        
+        if not NUMPY_AVAILABLE:
+            # igraph numbers communities densely from 0
+            groups: List[List[uuid.UUID]] = [[] for _ in range(max(membership) + 1)]
+            for node, community in zip(nodes, membership):
+                groups[community].append(node)
+            return dict(enumerate(groups))
+        
+        membership = np.asarray(membership, dtype=np.int64)
+        
+        # Group vertex ids by community with one stable sort; igraph numbers
+        # communities densely from 0, so group c is community c
+        order = np.argsort(membership, kind="stable")
+        boundaries = np.flatnonzero(np.diff(membership[order])) + 1
+        node_array = np.empty(len(nodes), dtype=object)
+        node_array[:] = nodes
+        return {
+            i: node_array[group].tolist()
+            for i, group in enumerate(np.split(order, boundaries))
+        }
 
 
 class LouvainCommunityStrategy(CommunityDetectionStrategy):
@@ -193,9 +430,20 @@ class LouvainCommunityStrategy(CommunityDetectionStrategy):
         if graph.number_of_nodes() == 0:
             return {}
         
+        if IGRAPH_AVAILABLE:
+            # Weighted, like NetworkX's louvain_communities
+            communities = self._detect_with_igraph(
+                graph, lambda ig_graph, weights: ig_graph.community_multilevel(weights=weights),
+                weighted=True
+            )
+            if communities is not None:
+                return communities
+        
         try:
             # Convert to undirected for community detection
-            undirected_graph = graph.to_undirected() if graph.is_directed() else graph
+            undirected_graph = graph.to_undirected(as_view=True) if graph.is_directed() else graph
+            # NetworkX scores each candidate move with the incremental
+            # modularity gain rather than recomputing the full modularity
             communities = nx.algorithms.community.louvain_communities(undirected_graph)
             
             # Convert to the expected format
@@ -207,10 +455,6 @@ class LouvainCommunityStrategy(CommunityDetectionStrategy):
         except nx.NetworkXError:
             # Fallback: return all nodes as single community
             return {0: list(graph.nodes())}
-    
-    def execute(self, graph: nx.Graph, **kwargs) -> Dict[int, List[uuid.UUID]]:
-        """Execute the strategy."""
-        return self.detect_communities(graph)
 
 
 class LabelPropagationCommunityStrategy(CommunityDetectionStrategy):
@@ -227,9 +471,17 @@ class LabelPropagationCommunityStrategy(CommunityDetectionStrategy):
         if graph.number_of_nodes() == 0:
             return {}
         
+        if IGRAPH_AVAILABLE:
+            # Unweighted, like NetworkX's label_propagation_communities
+            communities = self._detect_with_igraph(
+                graph, lambda ig_graph, weights: ig_graph.community_label_propagation(weights=None)
+            )
+            if communities is not None:
+                return communities
+        
         try:
             # Convert to undirected for community detection
-            undirected_graph = graph.to_undirected() if graph.is_directed() else graph
+            undirected_graph = graph.to_undirected(as_view=True) if graph.is_directed() else graph
             communities = nx.algorithms.community.label_propagation_communities(undirected_graph)
             
             # Convert to the expected format
@@ -241,10 +493,6 @@ class LabelPropagationCommunityStrategy(CommunityDetectionStrategy):
         except nx.NetworkXError:
             # Fallback: return all nodes as single community
             return {0: list(graph.nodes())}
-    
-    def execute(self, graph: nx.Graph, **kwargs) -> Dict[int, List[uuid.UUID]]:
-        """Execute the strategy."""
-        return self.detect_communities(graph)
 
 
 class GreedyModularityCommunityStrategy(CommunityDetectionStrategy):
@@ -261,9 +509,17 @@ class GreedyModularityCommunityStrategy(CommunityDetectionStrategy):
         if graph.number_of_nodes() == 0:
             return {}
         
+        if IGRAPH_AVAILABLE:
+            # Unweighted, like NetworkX's greedy_modularity_communities default
+            communities = self._detect_with_igraph(
+                graph, lambda ig_graph, weights: ig_graph.community_fastgreedy(weights=None).as_clustering()
+            )
+            if communities is not None:
+                return communities
+        
         try:
             # Convert to undirected for community detection
-            undirected_graph = graph.to_undirected() if graph.is_directed() else graph
+            undirected_graph = graph.to_undirected(as_view=True) if graph.is_directed() else graph
             communities = nx.algorithms.community.greedy_modularity_communities(undirected_graph)
             
             # Convert to the expected format
@@ -275,10 +531,44 @@ class GreedyModularityCommunityStrategy(CommunityDetectionStrategy):
         except nx.NetworkXError:
             # Fallback: return all nodes as single community
             return {0: list(graph.nodes())}
+
+
+def _paths_from_predecessors(predecessors: Dict[uuid.UUID, List[uuid.UUID]],
+                             source: uuid.UUID, target: uuid.UUID) -> Iterator[List[uuid.UUID]]:
+    """
+    Yield every shortest path from source to target encoded in predecessors.
     
-    def execute(self, graph: nx.Graph, **kwargs) -> Dict[int, List[uuid.UUID]]:
-        """Execute the strategy."""
-        return self.detect_communities(graph)
+    Paths are enumerated by an iterative depth-first walk from target back to
+    source over one preallocated path buffer; a list is only copied out of the
+    buffer when a complete path is yielded.
+    """
+    # Every shortest path has the same length, found by following first parents
+    length = 0
+    node = target
+    while node != source:
+        node = predecessors[node][0]
+        length += 1
+    
+    path: List[Any] = [None] * (length + 1)
+    path[length] = target
+    # Index of the next parent to try for the node at each buffer position
+    cursor = [0] * (length + 1)
+    pos = length
+    while pos <= length:
+        if pos == 0:
+            yield path[:]
+            pos += 1
+            continue
+        
+        parents = predecessors[path[pos]]
+        i = cursor[pos]
+        if i < len(parents):
+            cursor[pos] = i + 1
+            pos -= 1
+            path[pos] = parents[i]
+            cursor[pos] = 0
+        else:
+            pos += 1
 
 
 class PathFindingStrategy(Strategy):
@@ -323,18 +613,28 @@ class AllShortestPathsStrategy(PathFindingStrategy):
     
     def find_path(self, graph: nx.Graph, source: uuid.UUID, target: uuid.UUID) -> Optional[List[uuid.UUID]]:
         """Find the first shortest path (for compatibility with interface)."""
+        # A single path does not need the full predecessor tree
         try:
-            paths = list(nx.all_shortest_paths(graph, source, target))
-            return paths[0] if paths else None
+            path = nx.shortest_path(graph, source, target)
+            return path if isinstance(path, list) else None
         except (nx.NetworkXNoPath, nx.NodeNotFound):
             return None
     
     def find_all_paths(self, graph: nx.Graph, source: uuid.UUID, target: uuid.UUID) -> List[List[uuid.UUID]]:
         """Find all shortest paths between two nodes."""
+        return list(self.iter_all_paths(graph, source, target))
+    
+    def iter_all_paths(self, graph: nx.Graph, source: uuid.UUID, target: uuid.UUID) -> Iterator[List[uuid.UUID]]:
+        """Lazily yield all shortest paths between two nodes."""
         try:
-            return list(nx.all_shortest_paths(graph, source, target))
-        except (nx.NetworkXNoPath, nx.NodeNotFound):
-            return []
+            predecessors = nx.predecessor(graph, source)
+        except nx.NodeNotFound:
+            return iter(())
+        
+        if target not in predecessors:
+            return iter(())  # Target missing or unreachable
+        
+        return _paths_from_predecessors(predecessors, source, target)
     
     def execute(self, graph: nx.Graph, source: uuid.UUID, target: uuid.UUID, **kwargs) -> List[List[uuid.UUID]]:
         """Execute the strategy."""
@@ -358,67 +658,131 @@ class StrategyManager:
     """
     
     def __init__(self):
-        self._strategies: Dict[str, Dict[str, Strategy]] = {}
+        # (category, name) -> (strategy, metadata) for instantiated strategies
+        self._strategies: Dict[Tuple[str, str], Tuple[Strategy, StrategyMetadata]] = {}
+        # (category, name) -> factory for strategies not yet instantiated
+        self._strategy_factories: Dict[Tuple[str, str], Callable[[], Strategy]] = {}
+        # category -> strategy names in registration order
+        self._by_category: Dict[str, List[str]] = {}
         self._default_strategies: Dict[str, str] = {}
-        self._strategy_metadata: Dict[str, StrategyMetadata] = {}
+        # category -> resolved default strategy, dropped whenever the category changes
+        self._default_cache: Dict[str, Strategy] = {}
         
         # Register default strategies
         self._register_default_strategies()
     
     def _register_default_strategies(self) -> None:
-        """Register default strategies for different categories."""
+        """Register factories for the default strategies of each category."""
         # Centrality strategies
-        self.register_strategy("centrality", BetweennessCentralityStrategy())
-        self.register_strategy("centrality", ClosenessCentralityStrategy())
-        self.register_strategy("centrality", EigenvectorCentralityStrategy())
-        self.register_strategy("centrality", DegreeCentralityStrategy())
+        self.register_strategy_factory("centrality", "betweenness", BetweennessCentralityStrategy)
+        self.register_strategy_factory("centrality", "closeness", ClosenessCentralityStrategy)
+        self.register_strategy_factory("centrality", "eigenvector", EigenvectorCentralityStrategy)
+        self.register_strategy_factory("centrality", "degree", DegreeCentralityStrategy)
         self.set_default_strategy("centrality", "betweenness")
         
         # Community detection strategies
-        self.register_strategy("community", LouvainCommunityStrategy())
-        self.register_strategy("community", LabelPropagationCommunityStrategy())
-        self.register_strategy("community", GreedyModularityCommunityStrategy())
+        self.register_strategy_factory("community", "louvain", LouvainCommunityStrategy)
+        self.register_strategy_factory("community", "label_propagation", LabelPropagationCommunityStrategy)
+        self.register_strategy_factory("community", "greedy_modularity", GreedyModularityCommunityStrategy)
         self.set_default_strategy("community", "louvain")
         
         # Path finding strategies
-        self.register_strategy("pathfinding", ShortestPathStrategy())
-        self.register_strategy("pathfinding", AllShortestPathsStrategy())
+        self.register_strategy_factory("pathfinding", "shortest_path", ShortestPathStrategy)
+        self.register_strategy_factory("pathfinding", "all_shortest_paths", AllShortestPathsStrategy)
         self.set_default_strategy("pathfinding", "shortest_path")
     
-    def register_strategy(self, category: str, strategy: Strategy) -> None:
-        """Register a strategy for a specific category."""
-        if category not in self._strategies:
-            self._strategies[category] = {}
-        
-        strategy_name = strategy.get_name()
-        self._strategies[category][strategy_name] = strategy
-        
-        # Create metadata
-        self._strategy_metadata[f"{category}:{strategy_name}"] = StrategyMetadata(
-            name=strategy_name,
+    def _add_name(self, key: Tuple[str, str]) -> None:
+        """Record a newly registered strategy name under its category."""
+        names = self._by_category.setdefault(key[0], [])
+        if key not in self._strategies and key not in self._strategy_factories:
+            names.append(key[1])
+    
+    def _resolve(self, category: str, strategy_name: str) -> Optional[Tuple[Strategy, StrategyMetadata]]:
+        """Return the (strategy, metadata) record, instantiating a factory on first use."""
+        key = (category, strategy_name)
+        entry = self._strategies.get(key)
+        if entry is None:
+            factory = self._strategy_factories.pop(key, None)
+            if factory is None:
+                return None
+            entry = self._strategies[key] = self._make_entry(category, factory())
+        return entry
+    
+    @staticmethod
+    def _make_entry(category: str, strategy: Strategy) -> Tuple[Strategy, StrategyMetadata]:
+        """Pair a strategy with its metadata."""
+        return strategy, StrategyMetadata(
+            name=strategy.get_name(),
             description=strategy.get_description(),
             strategy_type=category,
             parameters={},
             performance_metrics={}
         )
     
+    def register_strategy(self, category: str, strategy: Strategy) -> None:
+        """Register a strategy for a specific category."""
+        key = (category, strategy.get_name())
+        self._default_cache.pop(category, None)
+        self._add_name(key)
+        self._strategy_factories.pop(key, None)
+        self._strategies[key] = self._make_entry(category, strategy)
+    
+    def register_strategy_factory(self, category: str, strategy_name: str,
+                                  factory: Callable[[], Strategy]) -> None:
+        """
+        Register a strategy that is only instantiated when first requested.
+        
+        Args:
+            category: Strategy category
+            strategy_name: Name the strategy is looked up by
+            factory: Zero-argument callable returning the strategy
+        """
+        key = (category, strategy_name)
+        self._default_cache.pop(category, None)
+        self._add_name(key)
+        self._strategies.pop(key, None)
+        self._strategy_factories[key] = factory
+    
     def get_strategy(self, category: str, strategy_name: Optional[str] = None) -> Optional[Strategy]:
         """Get a strategy by category and name."""
-        if category not in self._strategies:
-            return None
-        
         if strategy_name is None:
+            strategy = self._default_cache.get(category)
+            if strategy is not None:
+                return strategy
+            
             strategy_name = self._default_strategies.get(category)
+            if strategy_name is None:
+                return None
+            
+            entry = self._resolve(category, strategy_name)
+            if entry is None:
+                return None
+            strategy = self._default_cache[category] = entry[0]
+            return strategy
         
-        if strategy_name is None:
-            return None
+        entry = self._resolve(category, strategy_name)
+        return entry[0] if entry is not None else None
+    
+    def get_executor(self, category: str, strategy_name: Optional[str] = None) -> Callable[..., Any]:
+        """
+        Resolve a strategy once and return its bound ``execute`` method.
         
-        return self._strategies[category].get(strategy_name)
+        Intended for inner loops that would otherwise repeat the lookup on
+        every call. The returned callable keeps using the strategy resolved
+        here even if the manager is changed afterwards.
+        """
+        strategy = self.get_strategy(category, strategy_name)
+        if strategy is None:
+            raise ValueError(f"Strategy not found: {category}:{strategy_name}")
+        
+        return strategy.execute
     
     def set_default_strategy(self, category: str, strategy_name: str) -> None:
         """Set the default strategy for a category."""
-        if category in self._strategies and strategy_name in self._strategies[category]:
+        key = (category, strategy_name)
+        if key in self._strategies or key in self._strategy_factories:
             self._default_strategies[category] = strategy_name
+            self._default_cache.pop(category, None)
     
     def get_default_strategy(self, category: str) -> Optional[str]:
         """Get the default strategy name for a category."""
@@ -427,14 +791,14 @@ class StrategyManager:
     def list_strategies(self, category: Optional[str] = None) -> Dict[str, List[str]]:
         """List all available strategies."""
         if category is not None:
-            return {category: list(self._strategies.get(category, {}).keys())}
+            return {category: list(self._by_category.get(category, []))}
         
-        return {cat: list(strategies.keys()) for cat, strategies in self._strategies.items()}
+        return {cat: list(names) for cat, names in self._by_category.items()}
     
     def get_strategy_metadata(self, category: str, strategy_name: str) -> Optional[StrategyMetadata]:
         """Get metadata for a specific strategy."""
-        key = f"{category}:{strategy_name}"
-        return self._strategy_metadata.get(key)
+        entry = self._resolve(category, strategy_name)
+        return entry[1] if entry is not None else None
     
     def execute_strategy(self, category: str, strategy_name: Optional[str] = None, 
                         *args, **kwargs) -> Any:
@@ -447,24 +811,19 @@ class StrategyManager:
     
     def remove_strategy(self, category: str, strategy_name: str) -> bool:
         """Remove a strategy from the manager."""
-        if category not in self._strategies:
+        key = (category, strategy_name)
+        if (self._strategies.pop(key, None) is None
+                and self._strategy_factories.pop(key, None) is None):
             return False
         
-        if strategy_name not in self._strategies[category]:
-            return False
-        
-        del self._strategies[category][strategy_name]
-        
-        # Remove metadata
-        key = f"{category}:{strategy_name}"
-        if key in self._strategy_metadata:
-            del self._strategy_metadata[key]
+        self._default_cache.pop(category, None)
+        names = self._by_category[category]
+        names.remove(strategy_name)
         
         # Update default if necessary
         if self._default_strategies.get(category) == strategy_name:
-            remaining_strategies = list(self._strategies[category].keys())
-            if remaining_strategies:
-                self._default_strategies[category] = remaining_strategies[0]
+            if names:
+                self._default_strategies[category] = names[0]
             else:
                 del self._default_strategies[category]
         
@@ -473,33 +832,28 @@ class StrategyManager:
     def clear_strategies(self, category: Optional[str] = None) -> None:
         """Clear all strategies, optionally filtered by category."""
         if category is not None:
-            if category in self._strategies:
-                # Remove metadata for this category
-                for strategy_name in self._strategies[category]:
-                    key = f"{category}:{strategy_name}"
-                    if key in self._strategy_metadata:
-                        del self._strategy_metadata[key]
-                
-                del self._strategies[category]
-                if category in self._default_strategies:
-                    del self._default_strategies[category]
+            for strategy_name in self._by_category.pop(category, []):
+                self._strategies.pop((category, strategy_name), None)
+                self._strategy_factories.pop((category, strategy_name), None)
+            self._default_strategies.pop(category, None)
+            self._default_cache.pop(category, None)
         else:
             self._strategies.clear()
+            self._strategy_factories.clear()
+            self._by_category.clear()
             self._default_strategies.clear()
-            self._strategy_metadata.clear()
+            self._default_cache.clear()
     
     def get_categories(self) -> List[str]:
         """Get all strategy categories."""
-        return list(self._strategies.keys())
+        return list(self._by_category.keys())
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get statistics about registered strategies."""
-        total_strategies = sum(len(strategies) for strategies in self._strategies.values())
-        
         return {
-            "total_strategies": total_strategies,
-            "categories": len(self._strategies),
-            "strategies_by_category": {cat: len(strategies) for cat, strategies in self._strategies.items()},
+            "total_strategies": len(self._strategies) + len(self._strategy_factories),
+            "categories": len(self._by_category),
+            "strategies_by_category": {cat: len(names) for cat, names in self._by_category.items()},
             "default_strategies": self._default_strategies.copy()
         }
 
@@ -549,4 +903,32 @@ class CentralityAnalyzer:
             except Exception as e:
                 results[strategy_name] = f"Error: {str(e)}"
         
-        return results
\ No newline at end of file
+        return results
+    
+    def compare_centralities_for_nodes(self, graph: nx.Graph, node_ids: List[uuid.UUID],
+                                       strategies: Optional[List[str]] = None) -> Dict[uuid.UUID, Dict[str, Any]]:
+        """
+        Compare centrality values for several nodes at once.
+        
+        Each strategy scores the whole graph once and every requested node is
+        read from that result, instead of one calculation per node.
+        
+        Returns:
+            Mapping of node id to {strategy name: score or error message}
+        """
+        if strategies is None:
+            strategies = self.get_available_strategies()
+        
+        results: Dict[uuid.UUID, Dict[str, Any]] = {node_id: {} for node_id in node_ids}
+        for strategy_name in strategies:
+            try:
+                scores = self.calculate_all_centralities(graph, strategy_name)
+            except Exception as e:
+                for node_results in results.values():
+                    node_results[strategy_name] = f"Error: {str(e)}"
+                continue
+            
+            for node_id, node_results in results.items():
+                node_results[strategy_name] = scores.get(node_id, 0.0)
+        
+        return results